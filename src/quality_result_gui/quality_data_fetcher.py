@@ -83,6 +83,7 @@ class PollingWorker(QObject):
         self._timer: Optional[QTimer] = None
         self._poll_interval = poll_interval
         self._api_client = api_client
+        self._previous_result_ids: Optional[frozenset[str]] = None
 
     @pyqtSlot()
     def start(self) -> None:
@@ -108,7 +109,13 @@ class PollingWorker(QObject):
                 self.status_changed.emit(CheckStatus.RESULT_ONGOING)
             else:
                 self.status_changed.emit(CheckStatus.RESULT_UPDATED)
-                self.results_received.emit(results)
+
+                # Compare results here in the worker thread, so that unchanged
+                # results are not diffed against the models in the main thread
+                result_ids = frozenset(error.unique_identifier for error in results)
+                if result_ids != self._previous_result_ids:
+                    self._previous_result_ids = result_ids
+                    self.results_received.emit(results)
 
         except (QualityResultClientError, QualityResultServerError) as e:
             LOGGER.warning(
@@ -83,19 +83,23 @@ class QualityResultManager(QObject):
         self.dock_widget.closed.connect(self.closed)
 
         self.dock_widget.error_tree_view.errors_inserted.connect(
-            lambda errors: self.visualizer.add_new_errors(errors)
+            self.visualizer.add_new_errors
         )
         self.dock_widget.error_tree_view.errors_removed.connect(
-            lambda errors: self.visualizer.remove_errors(errors)
+            self.visualizer.remove_errors
         )
 
+        # Translate status texts once, status changes on every poll
+        self._status_texts = {
+            status: get_label() for status, get_label in CHECK_STATUS_LABELS.items()
+        }
         self._fetcher = BackgroundQualityResultsFetcher(self._api_client, self)
         self._fetcher.status_changed.connect(self._update_info_label)
 
         self._base_model = QualityErrorsTreeBaseModel()
         self._base_model.error_checked.connect(self.error_checked)
 
-        self._fetcher.results_received.connect(self._base_model.refresh_model)
+        self._fetcher.results_received.connect(self._refresh_model)
 
         self._filter_model = FilterProxyModel()
         self._filter_model.setSourceModel(self._base_model)
@@ -171,10 +175,20 @@ class QualityResultManager(QObject):
         self.dock_widget.deleteLater()
         self.visualizer.remove_quality_error_layer()
 
-    def _update_info_label(self, status: CheckStatus) -> None:
+    def _refresh_model(self, quality_errors: list[QualityError]) -> None:
+        # Repaint tree view and update visualized errors once
+        # after the whole model update
+        tree_view = self.dock_widget.error_tree_view
+        tree_view.setUpdatesEnabled(False)
         try:
-            status_text = CHECK_STATUS_LABELS[status]()
-        except ValueError:
+            with tree_view.batch_error_changes():
+                self._base_model.refresh_model(quality_errors)
+        finally:
+            tree_view.setUpdatesEnabled(True)
+
+    def _update_info_label(self, status: CheckStatus) -> None:
+        status_text = self._status_texts.get(status)
+        if status_text is None:
             status_text = tr("Status of fetching quality result unknown")
         self.dock_widget.info_label.setText(status_text)
 
@@ -67,9 +67,13 @@ class QualityErrorVisualizer:
             self.hide_errors()
 
     def add_new_errors(self, quality_errors: Iterable[QualityError]) -> None:
+        annotation_layer = self._quality_error_layer.annotation_layer
+        add_or_replace_annotation = self._quality_error_layer.add_or_replace_annotation
         for quality_error in quality_errors:
-            self._quality_error_layer.add_or_replace_annotation(
-                quality_error, use_highlighted_style=False
+            add_or_replace_annotation(
+                quality_error,
+                use_highlighted_style=False,
+                annotation_layer=annotation_layer,
             )
 
         # In dev mode define map extent when all errors are added to layer
@@ -77,7 +81,7 @@ class QualityErrorVisualizer:
             layer = self._quality_error_layer.find_layer_from_project()
             amount_of_added_errors = len(layer.items().keys()) if layer else 0
             if (
-                len(json.loads(Path(env.test_json_file_path).read_text()))
+                len(json.loads(Path(env.test_json_file_path).read_bytes()))
                 == amount_of_added_errors
                 and layer
             ):
@@ -29,7 +29,7 @@ from typing import (
     cast,
 )
 
-from qgis.PyQt.QtCore import QObject, QSignalBlocker, pyqtSignal
+from qgis.PyQt.QtCore import QObject, QSignalBlocker, pyqtSignal, pyqtSlot
 from qgis.PyQt.QtGui import QMouseEvent
 from qgis.PyQt.QtWidgets import QAction, QMenu
 from qgis_plugin_tools.tools.i18n import tr
@@ -50,6 +50,9 @@ class FilterMenu(QMenu):
     """A QMenu for checkable filter actions with support for select all section and
     sorting"""
 
+    # Emitted once after (de)selecting all, in addition to each action's toggled
+    filter_actions_toggled = pyqtSignal()
+
     def __init__(self, title: str, parent: Optional["QWidget"] = None) -> None:
         super().__init__(title, parent=parent)
 
@@ -57,6 +60,9 @@ class FilterMenu(QMenu):
         self._sorted = False
 
         self._filter_actions: list[QAction] = []
+        self._filter_action_labels: list[str] = []
+        self._num_unchecked_filter_actions = 0
+        self._setting_all_checked = False
 
     def mouseReleaseEvent(self, e: QMouseEvent) -> None:  # noqa: N802 (qt override)
         if not self.activeAction() or not self.activeAction().isEnabled():
@@ -81,6 +87,7 @@ class FilterMenu(QMenu):
 
         if sorted:
             self._filter_actions.sort(key=lambda action: action.text())
+            self._filter_action_labels.sort()
             for action in self._filter_actions:
                 self.removeAction(action)
                 self.addAction(action)
@@ -140,17 +147,52 @@ class FilterMenu(QMenu):
 
         self._select_all_section_enabled = False
 
+    def is_any_filter_active(self) -> bool:
+        """Checks if any of the user added checkable actions is unchecked
+
+        Returns:
+            bool: True if any of the filter actions is unchecked, False otherwise
+        """
+
+        return self._num_unchecked_filter_actions > 0
+
+    def is_setting_all_checked(self) -> bool:
+        """Checks if the actions are being toggled by (de)select all
+
+        Returns:
+            bool: True while (de)select all is toggling the filter actions,
+              False otherwise
+        """
+
+        return self._setting_all_checked
+
+    @pyqtSlot(bool)
+    def _on_filter_action_toggled(self, checked: bool) -> None:
+        self._num_unchecked_filter_actions += -1 if checked else 1
+
     def _select_all(self) -> None:
         """Select all the user added checkable actions"""
 
-        for action in self._filter_actions:
-            action.setChecked(True)
+        self._set_all_checked(True)
 
     def _deselect_all(self) -> None:
         """Deselects all the user added checkable actions"""
 
-        for action in self._filter_actions:
-            action.setChecked(False)
+        self._set_all_checked(False)
+
+    def _set_all_checked(self, checked: bool) -> None:
+        changed = False
+        self._setting_all_checked = True
+        try:
+            for action in self._filter_actions:
+                if action.isChecked() != checked:
+                    action.setChecked(checked)
+                    changed = True
+        finally:
+            self._setting_all_checked = False
+
+        if changed:
+            self.filter_actions_toggled.emit()
 
     def remove_user_actions(self) -> None:
         """Removes all the user added actions"""
@@ -172,9 +214,7 @@ class FilterMenu(QMenu):
         action.setChecked(True)
 
         if self._sorted:
-            insert_index = bisect.bisect_left(
-                [action.text() for action in self._filter_actions], label
-            )
+            insert_index = bisect.bisect_left(self._filter_action_labels, label)
             try:
                 before = self._filter_actions[insert_index]
             except IndexError:
@@ -185,6 +225,8 @@ class FilterMenu(QMenu):
 
         self.insertAction(before, action)
         self._filter_actions.insert(insert_index, action)
+        self._filter_action_labels.insert(insert_index, label)
+        action.toggled.connect(self._on_filter_action_toggled)
 
         return action
 
@@ -196,7 +238,12 @@ class FilterMenu(QMenu):
         """
 
         self.removeAction(action)
-        self._filter_actions.remove(action)
+        index = self._filter_actions.index(action)
+        del self._filter_actions[index]
+        del self._filter_action_labels[index]
+        action.toggled.disconnect(self._on_filter_action_toggled)
+        if not action.isChecked():
+            self._num_unchecked_filter_actions -= 1
         action.deleteLater()
 
 
@@ -231,6 +278,7 @@ class AbstractQualityErrorFilter(QObject):
         self._filter_value_action_map: dict[Hashable, QAction] = {}
 
         self.menu = FilterMenu(title)
+        self.menu.filter_actions_toggled.connect(self._sync_all_filtered)
 
     @abstractmethod
     def accept_row(
@@ -280,6 +328,19 @@ class AbstractQualityErrorFilter(QObject):
         else:
             self._accepted_values.remove(value)
 
+        # (De)select all notifies once after all the actions have been toggled
+        if not self.menu.is_setting_all_checked():
+            self.filters_changed.emit()
+
+    def _sync_all_filtered(self) -> None:
+        """Syncs accepted filter values from all the checkable actions"""
+
+        self._accepted_values = {
+            value
+            for value, action in self._filter_value_action_map.items()
+            if action.isChecked()
+        }
+
         self.filters_changed.emit()
 
     def _refresh_filters(self, new_filters: dict[Any, str]) -> None:
@@ -298,10 +359,13 @@ class AbstractQualityErrorFilter(QObject):
         values_to_be_removed = current_values - new_values
 
         for filter_value in values_to_be_removed:
-            self._remove_filter_item(filter_value)
+            self._remove_filter_item(filter_value, notify=False)
 
         for filter_value in values_to_be_added:
-            self._add_filter_item(filter_value, new_filters[filter_value])
+            self._add_filter_item(filter_value, new_filters[filter_value], notify=False)
+
+        if values_to_be_added or values_to_be_removed:
+            self.filters_changed.emit()
 
     def _refresh_error_type_filters(
         self, new_filters: dict[Any, Callable[[], str]]
@@ -321,20 +385,28 @@ class AbstractQualityErrorFilter(QObject):
         values_to_be_removed = current_values - new_values
 
         for filter_value in values_to_be_removed:
-            self._remove_filter_item(filter_value)
+            self._remove_filter_item(filter_value, notify=False)
 
         for filter_value in values_to_be_added:
             filter_label = new_filters[filter_value]()
-            self._add_filter_item(filter_value, filter_label)
+            self._add_filter_item(filter_value, filter_label, notify=False)
+
+        if values_to_be_added or values_to_be_removed:
+            self.filters_changed.emit()
 
     def _add_filter_item(
-        self, filter_value: Any, filter_label: str  # noqa: ANN401
+        self,
+        filter_value: Any,  # noqa: ANN401
+        filter_label: str,
+        notify: bool = True,
     ) -> None:
         """Adds a filter item to the filter
 
         Args:
             filter_value (Any): Value to be used when filtering
             filter_label (str): Label text shown in the menu
+            notify (bool, optional): Emit filters_changed after adding the item.
+              Defaults to True.
         """
 
         self._accepted_values.add(filter_value)
@@ -343,13 +415,18 @@ class AbstractQualityErrorFilter(QObject):
         self._filter_value_action_map[filter_value] = action
         action.toggled.connect(partial(self._sync_filtered, filter_value))
 
-        self.filters_changed.emit()
+        if notify:
+            self.filters_changed.emit()
 
-    def _remove_filter_item(self, filter_value: Any) -> None:  # noqa: ANN401
+    def _remove_filter_item(
+        self, filter_value: Any, notify: bool = True  # noqa: ANN401
+    ) -> None:
         """Removes the filter item
 
         Args:
             filter_value (Any): The Filter Value that should be removed from the filter
+            notify (bool, optional): Emit filters_changed after removing the item.
+              Defaults to True.
         """
 
         action = self._filter_value_action_map.pop(filter_value)
@@ -359,7 +436,8 @@ class AbstractQualityErrorFilter(QObject):
         if filter_value in self._accepted_values:
             self._accepted_values.remove(filter_value)
 
-        self.filters_changed.emit()
+        if notify:
+            self.filters_changed.emit()
 
 
 class ErrorTypeFilter(AbstractQualityErrorFilter):
@@ -32,6 +32,7 @@ from typing import (
     overload,
 )
 
+from qgis.core import QgsFeature, QgsSpatialIndex
 from qgis.gui import QgisInterface
 from qgis.PyQt.QtCore import (
     QAbstractItemModel,
@@ -40,6 +41,7 @@ from qgis.PyQt.QtCore import (
     QObject,
     QSortFilterProxyModel,
     Qt,
+    QTimer,
     QVariant,
     pyqtSignal,
 )
@@ -101,37 +103,36 @@ def get_error_feature_attributes(
 def _get_quality_errors_indexes(
     model: QAbstractItemModel, index: QModelIndex
 ) -> Iterator[QModelIndex]:
-    """Get quality all error indexes from index."""
+    """
+    Get quality all error indexes from index.
+
+    Tree is walked with an explicit stack instead of recursion, children are
+    pushed in reverse order so that indexes are yielded in row order.
+    """
     if not index.isValid():
         return
 
-    row_count = model.rowCount(index)
-    if row_count == 0:
-        data = index.data(Qt.UserRole)
-        (item_type, _) = cast(ErrorDataType, data)
-        if item_type == QualityErrorTreeItemType.ERROR:
-            # Index is for quality error row, which has no children
-            yield index
-    else:
-        for i in range(row_count):
-            yield from _get_quality_errors_indexes(model, index.child(i, 0))
+    model_index = model.index
+    row_count = model.rowCount
+    error_type = QualityErrorTreeItemType.ERROR
+
+    stack = [index]
+    while stack:
+        current = stack.pop()
+        num_children = row_count(current)
+        if num_children == 0:
+            data = current.data(Qt.UserRole)
+            if data is not None and data[0] == error_type:
+                # Index is for quality error row, which has no children
+                yield current
+        else:
+            stack.extend(
+                model_index(i, 0, current) for i in reversed(range(num_children))
+            )
 
 
 def _count_quality_error_rows(model: QAbstractItemModel, index: QModelIndex) -> int:
-    if not index.isValid():
-        return 0
-    num_rows = 0
-    row_count = model.rowCount(index)
-    if row_count == 0:
-        data = index.data(Qt.UserRole)
-        (item_type, _) = cast(ErrorDataType, data)
-        if item_type == QualityErrorTreeItemType.ERROR:
-            # Index is for quality error row
-            return 1
-    for i in range(row_count):
-        child_index = index.child(i, 0)
-        num_rows += _count_quality_error_rows(model, child_index)
-    return num_rows
+    return sum(1 for _ in _get_quality_errors_indexes(model, index))
 
 
 def _count_all_rows(model: QAbstractItemModel) -> int:
@@ -157,6 +158,16 @@ ErrorDataType = NewType(
 
 
 class QualityErrorTreeItem:
+    # One item is created for every row, avoid a __dict__ for each
+    __slots__ = (
+        "key",
+        "_item_parent",
+        "_item_data",
+        "_child_items",
+        "_child_item_map",
+        "item_type",
+    )
+
     def __init__(
         self,
         data: list[Any],
@@ -178,7 +189,8 @@ class QualityErrorTreeItem:
 
     def remove_child_item(self, item: "QualityErrorTreeItem") -> None:
         self._child_items.remove(item)
-        self._child_item_map.pop(item.key)
+        # Duplicate keys share the map entry
+        self._child_item_map.pop(item.key, None)
 
     def get_child_by_key(self, key: str) -> "QualityErrorTreeItem":
         return self._child_items[self._child_item_map[key]]
@@ -226,7 +238,8 @@ class QualityErrorTreeItem:
 
         if role == Qt.DisplayRole and column == ModelColumn.TYPE_OR_ID:
             if self.item_type == QualityErrorTreeItemType.PRIORITY:
-                column_data = ERROR_PRIORITY_LABEL[QualityErrorPriority(item_data)]()
+                # Priority items hold the enum member already
+                column_data = ERROR_PRIORITY_LABEL[item_data]()
 
             elif self.item_type == QualityErrorTreeItemType.FEATURE_TYPE:
                 column_data = (
@@ -303,7 +316,11 @@ class QualityErrorsTreeBaseModel(QAbstractItemModel):
                 QualityErrorTreeItemType.PRIORITY,
                 self._root_item,
             )
-            self._add_item_to_model(priority_item, self._root_item)
+            self._add_items_to_model([priority_item], self._root_item)
+
+        # Quality error items by their unique identifiers, the same identifier
+        # may be received more than once
+        self._quality_error_items: dict[str, list[QualityErrorTreeItem]] = {}
 
     def index(self, row: int, column: int, parent: QModelIndex) -> QModelIndex:
         if not self.hasIndex(row, column, parent):
@@ -357,6 +374,19 @@ class QualityErrorsTreeBaseModel(QAbstractItemModel):
 
         return parent_item.child_count()
 
+    def hasChildren(self, parent: QModelIndex) -> bool:  # noqa: N802  (qt override)
+        if parent.column() > 0:
+            return False
+
+        if not parent.isValid():
+            parent_item = self._root_item
+        else:
+            parent_item = parent.internalPointer()
+
+        # Answer directly from the item, default implementation
+        # would query both rowCount and columnCount through the bindings
+        return parent_item.child_count() > 0
+
     def columnCount(self, parent: QModelIndex) -> int:  # noqa: N802  (qt override)
         if not parent.isValid():
             parent_item = self._root_item
@@ -450,16 +480,7 @@ class QualityErrorsTreeBaseModel(QAbstractItemModel):
         updated_quality_error_ids = {
             error.unique_identifier for error in quality_errors
         }
-
-        current_quality_error_ids = set()
-        for i in range(self.rowCount(QModelIndex())):
-            for index in _get_quality_errors_indexes(
-                self, self.index(i, 0, QModelIndex())
-            ):
-                _, item_data = index.data(Qt.UserRole)
-                current_quality_error_ids.add(
-                    cast(QualityError, item_data).unique_identifier
-                )
+        current_quality_error_ids = self._quality_error_items.keys()
 
         deleted_error_ids = current_quality_error_ids - updated_quality_error_ids
         new_error_ids = updated_quality_error_ids - current_quality_error_ids
@@ -474,15 +495,12 @@ class QualityErrorsTreeBaseModel(QAbstractItemModel):
             if error.unique_identifier in new_error_ids
         )
 
-        errors_to_be_deleted: list[tuple[QualityErrorTreeItem, QModelIndex]] = []
-
-        for i in range(self.rowCount(QModelIndex())):
-            for index in _get_quality_errors_indexes(
-                self, self.index(i, 0, QModelIndex())
-            ):
-                item: QualityErrorTreeItem = index.internalPointer()
-                if item.key in deleted_error_ids:
-                    errors_to_be_deleted.append((item, index))
+        errors_to_be_deleted = [
+            item
+            for error_id, items in self._quality_error_items.items()
+            if error_id in deleted_error_ids
+            for item in items
+        ]
 
         self._update_model_data(errors_to_be_added, errors_to_be_deleted)
 
@@ -491,81 +509,117 @@ class QualityErrorsTreeBaseModel(QAbstractItemModel):
     def _update_model_data(
         self,
         errors_to_be_added: Iterable[QualityError],
-        errors_to_be_deleted: list[tuple[QualityErrorTreeItem, QModelIndex]],
+        errors_to_be_deleted: list[QualityErrorTreeItem],
     ) -> None:
         """
         Updates model data based on new and deleted quality errors.
 
-        Deletion of quality errors must be done in reversed order for model
-        indices to stay valid during the update process. New items are added
-        after deletion. Empty parents are left to the model as filter model
-        will leave them out eventually.
+        Deleted quality errors are removed first, their rows are resolved
+        only when each of them is removed. New items are added after
+        deletion. Empty parents are left to the model as filter model will
+        leave them out eventually.
+
+        New items are grouped by their parents and inserted once per parent
+        already in the model, new parent items are inserted together with
+        all of their children.
         """
         # Remove quality error items that are no longer found from errors
-        for item, item_index in reversed(errors_to_be_deleted):
-            self._remove_item_from_model(item, item_index)
+        for item in errors_to_be_deleted:
+            self._remove_item_from_model(item)
+            self._quality_error_items.pop(item.key, None)
 
-        # Add new quality error items and parent items for them if needed
+        grouped_errors: dict[str, dict[str, dict[str, list[QualityError]]]] = {}
         for quality_error in errors_to_be_added:
-            priority_item = self._root_item.get_child_by_key(
-                str(quality_error.priority.value)
+            errors_by_feature_type = grouped_errors.setdefault(
+                str(quality_error.priority.value), {}
+            )
+            errors_by_feature = errors_by_feature_type.setdefault(
+                quality_error.feature_type, {}
+            )
+            errors_by_feature.setdefault(quality_error.feature_id, []).append(
+                quality_error
             )
 
-            try:
-                feature_type_item = priority_item.get_child_by_key(
-                    quality_error.feature_type
-                )
-            except KeyError:
-                feature_type_item = QualityErrorTreeItem(
-                    [quality_error.feature_type, None],
-                    quality_error.feature_type,
-                    QualityErrorTreeItemType.FEATURE_TYPE,
-                    priority_item,
-                )
-                self._add_item_to_model(
-                    feature_type_item,
-                    priority_item,
-                )
+        # Add new quality error items and parent items for them if needed
+        for priority_key, errors_by_feature_type in grouped_errors.items():
+            priority_item = self._root_item.get_child_by_key(priority_key)
+            new_feature_type_items: list[QualityErrorTreeItem] = []
+
+            for feature_type, errors_by_feature in errors_by_feature_type.items():
+                try:
+                    feature_type_item = priority_item.get_child_by_key(feature_type)
+                    is_feature_type_in_model = True
+                except KeyError:
+                    feature_type_item = QualityErrorTreeItem(
+                        [feature_type, None],
+                        feature_type,
+                        QualityErrorTreeItemType.FEATURE_TYPE,
+                        priority_item,
+                    )
+                    new_feature_type_items.append(feature_type_item)
+                    is_feature_type_in_model = False
+
+                new_feature_items: list[QualityErrorTreeItem] = []
+
+                for feature_id, quality_errors in errors_by_feature.items():
+                    try:
+                        feature_item = feature_type_item.get_child_by_key(feature_id)
+                        is_feature_in_model = is_feature_type_in_model
+                    except KeyError:
+                        feature_item = QualityErrorTreeItem(
+                            [(feature_type, feature_id), None],
+                            feature_id,
+                            QualityErrorTreeItemType.FEATURE,
+                            feature_type_item,
+                        )
+                        new_feature_items.append(feature_item)
+                        is_feature_in_model = False
+
+                    quality_error_items = [
+                        self._create_quality_error_item(quality_error, feature_item)
+                        for quality_error in quality_errors
+                    ]
+                    for item in quality_error_items:
+                        self._quality_error_items.setdefault(item.key, []).append(item)
+                    self._add_child_items(
+                        quality_error_items, feature_item, is_feature_in_model
+                    )
 
-            try:
-                feature_item = feature_type_item.get_child_by_key(
-                    quality_error.feature_id
-                )
-            except KeyError:
-                feature_item = QualityErrorTreeItem(
-                    [
-                        (
-                            quality_error.feature_type,
-                            quality_error.feature_id,
-                        ),
-                        None,
-                    ],
-                    quality_error.feature_id,
-                    QualityErrorTreeItemType.FEATURE,
-                    feature_type_item,
-                )
-                self._add_item_to_model(
-                    feature_item,
-                    feature_type_item,
+                self._add_child_items(
+                    new_feature_items, feature_type_item, is_feature_type_in_model
                 )
 
-            quality_error_item = QualityErrorTreeItem(
-                [
-                    quality_error,
-                    {
-                        "error_description": quality_error["error_description"],
-                        "error_extra_info": quality_error["error_extra_info"],
-                    },
-                ],
-                quality_error.unique_identifier,
-                QualityErrorTreeItemType.ERROR,
-                feature_item,
-            )
+            self._add_child_items(new_feature_type_items, priority_item, True)
 
-            self._add_item_to_model(
-                quality_error_item,
-                feature_item,
-            )
+    @staticmethod
+    def _create_quality_error_item(
+        quality_error: QualityError, feature_item: QualityErrorTreeItem
+    ) -> QualityErrorTreeItem:
+        return QualityErrorTreeItem(
+            [
+                quality_error,
+                {
+                    "error_description": quality_error["error_description"],
+                    "error_extra_info": quality_error["error_extra_info"],
+                },
+            ],
+            quality_error.unique_identifier,
+            QualityErrorTreeItemType.ERROR,
+            feature_item,
+        )
+
+    def _add_child_items(
+        self,
+        items: list[QualityErrorTreeItem],
+        item_parent: QualityErrorTreeItem,
+        is_parent_in_model: bool,
+    ) -> None:
+        if is_parent_in_model:
+            self._add_items_to_model(items, item_parent)
+        else:
+            # Parent is inserted to the model later together with its children
+            for item in items:
+                item_parent.append_child_item(item)
 
     def _get_index_for_item(self, item: QualityErrorTreeItem) -> QModelIndex:
         if item.item_type == QualityErrorTreeItemType.HEADER:
@@ -576,29 +630,27 @@ class QualityErrorsTreeBaseModel(QAbstractItemModel):
                 raise ValueError
             return self.index(item.row(), 0, self._get_index_for_item(item_parent))
 
-    def _remove_item_from_model(
-        self,
-        item: QualityErrorTreeItem,
-        item_index: QModelIndex,
-    ) -> None:
+    def _remove_item_from_model(self, item: QualityErrorTreeItem) -> None:
         item_parent = item.parent()
         if item_parent is None:
             return
 
-        self.beginRemoveRows(item_index.parent(), item.row(), item.row())
+        row = item.row()
+        self.beginRemoveRows(self._get_index_for_item(item_parent), row, row)
         item_parent.remove_child_item(item)
         self.endRemoveRows()
 
-    def _add_item_to_model(
-        self, item: QualityErrorTreeItem, item_parent: QualityErrorTreeItem
+    def _add_items_to_model(
+        self, items: list[QualityErrorTreeItem], item_parent: QualityErrorTreeItem
     ) -> None:
+        if not items:
+            return
+
         parent_index = self._get_index_for_item(item_parent)
-        self.beginInsertRows(
-            parent_index,
-            item_parent.child_count(),
-            item_parent.child_count(),
-        )
-        item_parent.append_child_item(item)
+        first_row = item_parent.child_count()
+        self.beginInsertRows(parent_index, first_row, first_row + len(items) - 1)
+        for item in items:
+            item_parent.append_child_item(item)
         self.endInsertRows()
 
 
@@ -610,13 +662,30 @@ class StyleProxyModel(QIdentityProxyModel):
         self, index: QModelIndex, role: Qt.ItemDataRole = Qt.DisplayRole
     ) -> QVariant:
         source_index = self.mapToSource(index)
-        data = self.sourceModel().data(source_index, Qt.UserRole)
 
-        if not QVariant(data).isValid():
-            return self.sourceModel().data(source_index, role)
+        # Only font and foreground are styled here, other roles (including the
+        # user role read for every row) are passed through with one lookup
+        if role in (Qt.FontRole, Qt.ForegroundRole):
+            data = self.sourceModel().data(source_index, Qt.UserRole)
 
-        (item_type, item_data) = cast(ErrorDataType, data)
-        column = ModelColumn(index.column())
+            # Invalid variants are converted to None by the bindings
+            if data is not None:
+                (item_type, item_data) = cast(ErrorDataType, data)
+                styled_data = self._get_styled_data(
+                    item_type, item_data, ModelColumn(index.column()), role
+                )
+                if styled_data is not None:
+                    return styled_data
+
+        return self.sourceModel().data(source_index, role)
+
+    @staticmethod
+    def _get_styled_data(
+        item_type: QualityErrorTreeItemType,
+        item_data: Any,  # noqa: ANN401
+        column: ModelColumn,
+        role: Qt.ItemDataRole,
+    ) -> Optional[QVariant]:
         if (
             role == Qt.FontRole
             and column == ModelColumn.TYPE_OR_ID
@@ -653,7 +722,7 @@ class StyleProxyModel(QIdentityProxyModel):
             color.setRgb(75, 75, 75)
             return QVariant(color)
 
-        return self.sourceModel().data(source_index, role)
+        return None
 
 
 class AbstractFilterProxyModel(QSortFilterProxyModel):
@@ -676,7 +745,7 @@ class AbstractFilterProxyModel(QSortFilterProxyModel):
             return True
 
         data = self.sourceModel().data(source_index, self.filterRole())
-        if not QVariant(data).isValid():
+        if data is None:
             # Always accept anything that did not return valid data
             return True
 
@@ -759,26 +828,134 @@ class FilterProxyModel(AbstractFilterProxyModel):
 
 
 class FilterByExtentProxyModel(AbstractFilterProxyModel):
+    # Refilter only after map extent has stayed the same for this long (ms)
+    EXTENT_CHANGE_DEBOUNCE_INTERVAL = 120
+
     def __init__(self, parent: Optional[QObject] = None) -> None:
         super().__init__(parent)
 
         self._extent: Union["QgsRectangle", None] = None
 
+        # Bounding boxes of the filtered errors, used to reject errors far from
+        # the extent without testing their geometries one by one
+        self._spatial_index = QgsSpatialIndex()
+        # Indexed errors with their spatial index feature ids by error ids
+        self._indexed_errors: dict[str, tuple[int, QualityError]] = {}
+        self._indexed_error_ids: dict[int, str] = {}
+        self._next_feature_id = 0
+        self._error_ids_near_extent: set[str] = set()
+
+        self._is_map_extent_connected = False
+        self._extent_change_timer = QTimer(self)
+        self._extent_change_timer.setSingleShot(True)
+        self._extent_change_timer.setInterval(self.EXTENT_CHANGE_DEBOUNCE_INTERVAL)
+        self._extent_change_timer.timeout.connect(self._apply_map_extent)
+
+    def setSourceModel(  # noqa: N802 (qt override)
+        self, source_model: QAbstractItemModel
+    ) -> None:
+        previous_source_model = self.sourceModel()
+        if previous_source_model is not None:
+            previous_source_model.rowsAboutToBeRemoved.disconnect(
+                self._on_source_rows_about_to_be_removed
+            )
+            previous_source_model.modelReset.disconnect(self._clear_spatial_index)
+
+        super().setSourceModel(source_model)
+
+        # Errors leaving the source model are removed from the spatial index
+        source_model.rowsAboutToBeRemoved.connect(
+            self._on_source_rows_about_to_be_removed
+        )
+        source_model.modelReset.connect(self._clear_spatial_index)
+
     def set_extent(self, extent: Union["QgsRectangle", None]) -> None:
         self._extent = extent
+        if extent is None:
+            self._error_ids_near_extent = set()
+        else:
+            error_ids = self._indexed_error_ids
+            self._error_ids_near_extent = {
+                error_ids[feature_id]
+                for feature_id in self._spatial_index.intersects(extent)
+            }
         self.invalidateFilter()
 
+    def _clear_spatial_index(self) -> None:
+        self._spatial_index = QgsSpatialIndex()
+        self._indexed_errors = {}
+        self._indexed_error_ids = {}
+        self._next_feature_id = 0
+        self._error_ids_near_extent = set()
+
+    def _add_to_spatial_index(self, quality_error: QualityError) -> None:
+        bounding_box = quality_error.geometry.boundingBox()
+        feature_id = self._next_feature_id
+        self._next_feature_id += 1
+        self._indexed_error_ids[feature_id] = quality_error.unique_identifier
+        self._indexed_errors[quality_error.unique_identifier] = (
+            feature_id,
+            quality_error,
+        )
+        self._spatial_index.addFeature(feature_id, bounding_box)
+
+        if self._extent is not None and bounding_box.intersects(self._extent):
+            self._error_ids_near_extent.add(quality_error.unique_identifier)
+
+    def _remove_from_spatial_index(self, quality_error: QualityError) -> None:
+        error_id = quality_error.unique_identifier
+        feature_id, indexed_error = self._indexed_errors.get(error_id, (None, None))
+        if feature_id is None or indexed_error is not quality_error:
+            return
+
+        # Feature is found from the index by its id and bounding box
+        feature = QgsFeature(feature_id)
+        feature.setGeometry(quality_error.geometry)
+        self._spatial_index.deleteFeature(feature)
+
+        del self._indexed_errors[error_id]
+        del self._indexed_error_ids[feature_id]
+        self._error_ids_near_extent.discard(error_id)
+
+    def _on_source_rows_about_to_be_removed(
+        self, parent: QModelIndex, first: int, last: int
+    ) -> None:
+        if not self._indexed_errors:
+            return
+
+        source_model = self.sourceModel()
+        for row in range(first, last + 1):
+            for index in _get_quality_errors_indexes(
+                source_model, source_model.index(row, 0, parent)
+            ):
+                _, quality_error = index.data(Qt.UserRole)
+                self._remove_from_spatial_index(quality_error)
+
     def _on_map_extent_changed(self) -> None:
+        # Extent changes continuously while panning, restart pending update
+        self._extent_change_timer.start()
+
+    def _apply_map_extent(self) -> None:
         self.set_extent(iface.mapCanvas().extent())
 
     def set_enabled(self, enabled: bool) -> None:
         if enabled:
-            iface.mapCanvas().extentsChanged.connect(self._on_map_extent_changed)
-            self.set_extent(iface.mapCanvas().extent())
+            # Connect only once, each connection would trigger its own update
+            if not self._is_map_extent_connected:
+                iface.mapCanvas().extentsChanged.connect(self._on_map_extent_changed)
+                self._is_map_extent_connected = True
+            self._apply_map_extent()
         else:
-            with contextlib.suppress(TypeError):  # Ignore case when not connected
-                iface.mapCanvas().extentsChanged.disconnect(self._on_map_extent_changed)
+            if self._is_map_extent_connected:
+                # Canvas may already be deleted when closing
+                with contextlib.suppress(TypeError, RuntimeError):
+                    iface.mapCanvas().extentsChanged.disconnect(
+                        self._on_map_extent_changed
+                    )
+                self._is_map_extent_connected = False
 
+            self._extent_change_timer.stop()
+            self._clear_spatial_index()
             self.set_extent(None)
 
     def accept_row(
@@ -793,6 +970,17 @@ class FilterByExtentProxyModel(AbstractFilterProxyModel):
 
         quality_error = cast(QualityError, tree_item_value)
 
+        # Rows outside the extent are rejected without touching their geometries
+        _, indexed_error = self._indexed_errors.get(
+            quality_error.unique_identifier, (None, None)
+        )
+        if indexed_error is quality_error:
+            if quality_error.unique_identifier not in self._error_ids_near_extent:
+                # Bounding box is outside the extent, geometry cannot intersect
+                return False
+        elif indexed_error is None and not quality_error.geometry.isNull():
+            self._add_to_spatial_index(quality_error)
+
         return quality_error.geometry.intersects(self._extent)
 
     def headerData(  # noqa: N802 (qt override)
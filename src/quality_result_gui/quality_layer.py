@@ -22,6 +22,7 @@ from collections.abc import Iterable
 from typing import TYPE_CHECKING, Optional, Union
 
 from qgis.core import (
+    QgsAbstractGeometry,
     QgsAnnotationLayer,
     QgsAnnotationLineItem,
     QgsAnnotationMarkerItem,
@@ -117,11 +118,20 @@ class QualityErrorLayer:
         quality_error: "QualityError",
         use_highlighted_style: bool,
         id_prefix: str = "",
+        annotation_layer: Optional[QgsAnnotationLayer] = None,
     ) -> None:
-        annotation_layer = self.annotation_layer
+        """
+        Adds annotations for the quality error or replaces the existing ones.
+
+        Annotation layer is searched from the project if not given, pass
+        it when adding multiple errors to avoid searching it for each.
+        """
         if quality_error.geometry.isNull():
             return
 
+        if annotation_layer is None:
+            annotation_layer = self.annotation_layer
+
         annotations = self._create_annotations(
             quality_error,
             use_highlighted_style,
@@ -166,7 +176,32 @@ class QualityErrorLayer:
                 # Consume exception, feature is not found
                 pass
 
-    def _create_annotations(  # noqa: C901, PLR0912
+    @staticmethod
+    def _get_geometry_parts(geometry: QgsGeometry) -> list[QgsAbstractGeometry]:
+        """Returns single part geometries of the geometry."""
+        geom_type = geometry.type()
+        if geom_type == QgsWkbTypes.PointGeometry:
+            part_type: type[QgsAbstractGeometry] = QgsPoint
+        elif geom_type == QgsWkbTypes.PolygonGeometry:
+            part_type = QgsPolygon
+        elif geom_type == QgsWkbTypes.LineGeometry:
+            part_type = QgsLineString
+        else:
+            raise ValueError(f"Unsupported geom type: {geom_type}")
+
+        if geometry.isMultipart() is False:
+            wkts = [geometry.asWkt()]
+        else:
+            wkts = [part.asWkt() for part in geometry.constParts()]
+
+        parts: list[QgsAbstractGeometry] = []
+        for wkt in wkts:
+            part = part_type()
+            part.fromWkt(wkt)
+            parts.append(part)
+        return parts
+
+    def _create_annotations(
         self,
         quality_error: "QualityError",
         use_highlighted_style: bool,
@@ -178,80 +213,21 @@ class QualityErrorLayer:
                 QgsAnnotationMarkerItem, QgsAnnotationPolygonItem, QgsAnnotationLineItem
             ]
         ] = []
-        geometry = quality_error.geometry
-        geom_type = geometry.type()
-
-        original_abstract_geometry = geometry.get()
-        cloned_original_abstract_geometry = original_abstract_geometry.clone()
-        cloned_geom = QgsGeometry(cloned_original_abstract_geometry)
-
-        annotation = None
+        geom_type = quality_error.geometry.type()
+        parts = self._get_geometry_parts(quality_error.geometry)
 
         symbol = self.style.create_error_symbol(quality_error)
 
-        if geom_type == QgsWkbTypes.PointGeometry:
-            points = []
-            if geometry.isMultipart() is False:
-                point = QgsPoint()
-                point.fromWkt(cloned_geom.asWkt())
-                points.append(point)
-            else:
-                for part in cloned_geom.constParts():
-                    point = QgsPoint()
-                    point.fromWkt(part.asWkt())
-                    points.append(point)
-
-            for point in points:
-                annotation = QgsAnnotationMarkerItem(point)
-                annotation.setSymbol(
-                    symbol.to_qgs_symbol(geom_type, use_highlighted_style)
-                )
-                annotations.append(annotation)
-
-        elif geom_type == QgsWkbTypes.PolygonGeometry:
-            polygons = []
-
-            if geometry.isMultipart() is False:
-                polygon = QgsPolygon()
-                polygon.fromWkt(geometry.asWkt())
-                polygons.append(polygon)
-            else:
-                for part in geometry.constParts():
-                    polygon = QgsPolygon()
-                    polygon.fromWkt(part.asWkt())
-                    polygons.append(polygon)
-
-            for polygon in polygons:
-                annotation = QgsAnnotationPolygonItem(polygon)
-                annotation.setSymbol(
-                    symbol.to_qgs_symbol(geom_type, use_highlighted_style)
-                )
-                annotations.append(annotation)
-
-        elif geom_type == QgsWkbTypes.LineGeometry:
-            lines = []
-            if geometry.isMultipart() is False:
-                line = QgsLineString()
-                line.fromWkt(cloned_geom.asWkt())
-                lines.append(line)
+        for part in parts:
+            if geom_type == QgsWkbTypes.PointGeometry:
+                annotation = QgsAnnotationMarkerItem(part)
+            elif geom_type == QgsWkbTypes.PolygonGeometry:
+                annotation = QgsAnnotationPolygonItem(part)
             else:
-                for part in cloned_geom.constParts():
-                    line = QgsLineString()
-                    line.fromWkt(part.asWkt())
-                    lines.append(line)
-
-            for line in lines:
-                annotation = QgsAnnotationLineItem(line)
-                annotation.setSymbol(
-                    symbol.to_qgs_symbol(geom_type, use_highlighted_style)
-                )
-                annotations.append(annotation)
-
-        else:
-            raise ValueError(f"Unsupported geom type: {geom_type}")
-
-        for annotation in annotations:
+                annotation = QgsAnnotationLineItem(part)
+            annotation.setSymbol(symbol.to_qgs_symbol(geom_type, use_highlighted_style))
             # Set z-index based on the priority
             annotation.setZIndex(-quality_error.priority.value)
+            annotations.append(annotation)
 
         return annotations
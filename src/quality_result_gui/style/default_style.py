@@ -83,15 +83,15 @@ class QualityLayerStyle:
 
 COLORS_FOR_ERRORS = {
     QualityErrorPriority.FATAL: QualityLayerColors(
-        stroke_color=FATAL_PRIMARY_COLOR,
+        stroke_color=QColor(FATAL_PRIMARY_COLOR),
         secondary_color=styling_utils.get_color(FATAL_SECONDARY_COLOR, opacity=30),
     ),
     QualityErrorPriority.WARNING: QualityLayerColors(
-        stroke_color=WARNING_PRIMARY_COLOR,
+        stroke_color=QColor(WARNING_PRIMARY_COLOR),
         secondary_color=styling_utils.get_color(WARNING_SECONDARY_COLOR, opacity=30),
     ),
     QualityErrorPriority.INFO: QualityLayerColors(
-        stroke_color=INFO_PRIMARY_COLOR,
+        stroke_color=QColor(INFO_PRIMARY_COLOR),
         secondary_color=styling_utils.get_color(INFO_SECONDARY_COLOR, opacity=30),
     ),
 }
@@ -99,14 +99,14 @@ COLORS_FOR_ERRORS = {
 
 COLORS_FOR_HIGHLIGHTED_ERRORS = {
     QualityErrorPriority.FATAL: QualityLayerColors(
-        stroke_color=HIGHLIGHTED_FATAL_PRIMARY_COLOR,
+        stroke_color=QColor(HIGHLIGHTED_FATAL_PRIMARY_COLOR),
         fill_color=styling_utils.get_color(HIGHLIGHTED_FATAL_PRIMARY_COLOR, opacity=40),
         secondary_color=styling_utils.get_color(
             HIGHLIGHTED_FATAL_SECONDARY_COLOR, opacity=30
         ),
     ),
     QualityErrorPriority.WARNING: QualityLayerColors(
-        stroke_color=HIGHLIGHTED_WARNING_PRIMARY_COLOR,
+        stroke_color=QColor(HIGHLIGHTED_WARNING_PRIMARY_COLOR),
         fill_color=styling_utils.get_color(
             HIGHLIGHTED_WARNING_PRIMARY_COLOR, opacity=40
         ),
@@ -115,7 +115,7 @@ COLORS_FOR_HIGHLIGHTED_ERRORS = {
         ),
     ),
     QualityErrorPriority.INFO: QualityLayerColors(
-        stroke_color=HIGHLIGHTED_INFO_PRIMARY_COLOR,
+        stroke_color=QColor(HIGHLIGHTED_INFO_PRIMARY_COLOR),
         fill_color=styling_utils.get_color(HIGHLIGHTED_INFO_PRIMARY_COLOR, opacity=40),
         secondary_color=styling_utils.get_color(
             HIGHLIGHTED_INFO_SECONDARY_COLOR, opacity=30
@@ -175,31 +175,18 @@ class DefaultErrorSymbol(ErrorSymbol):
         )
         symbol.changeSymbolLayer(0, fill_symbol_layer)
 
-        primary_border_symbol_layer = QgsSimpleLineSymbolLayer.create(
-            {
-                "line_color": self.color_to_rgba_string(colors.stroke_color),
-                "line_width": str(style.polygon_border_width),
-                "line_width_unit": "MM",
-            }
+        primary_border_symbol_layer = self._build_primary_border(
+            style.polygon_border_width, colors.stroke_color
         )
         symbol.appendSymbolLayer(primary_border_symbol_layer)
 
-        secondary_border_symbol_layer = QgsSimpleLineSymbolLayer.create(
-            {
-                "line_color": self.color_to_rgba_string(colors.secondary_color),
-                "line_width": "3.4",
-                "line_width_unit": "MM",
-                "joinstyle": "round",
-            }
+        secondary_border_symbol_layer = self._build_secondary_border(
+            colors.secondary_color
         )
         symbol.appendSymbolLayer(secondary_border_symbol_layer)
 
-        priority_symbol_layer = self._create_priority_symbol_layer(self.priority)
-        marker_symbol = QgsMarkerSymbol()
-        marker_symbol.changeSymbolLayer(0, priority_symbol_layer)
-
         centroid_layer = QgsCentroidFillSymbolLayer.create({})
-        centroid_layer.setSubSymbol(marker_symbol)
+        centroid_layer.setSubSymbol(self._build_priority_marker_symbol())
 
         symbol.appendSymbolLayer(centroid_layer)
 
@@ -225,34 +212,21 @@ class DefaultErrorSymbol(ErrorSymbol):
 
         line_symbol = QgsLineSymbol()
 
-        primary_border_symbol_layer = QgsSimpleLineSymbolLayer.create(
-            {
-                "line_color": self.color_to_rgba_string(modified_stroke_color),
-                "line_width": str(style.line_width),
-                "line_width_unit": "MM",
-            }
+        primary_border_symbol_layer = self._build_primary_border(
+            style.line_width, modified_stroke_color
         )
         line_symbol.changeSymbolLayer(0, primary_border_symbol_layer)
 
-        secondary_border_symbol_layer = QgsSimpleLineSymbolLayer.create(
-            {
-                "line_color": self.color_to_rgba_string(colors.secondary_color),
-                "line_width": "3.4",
-                "line_width_unit": "MM",
-                "joinstyle": "round",
-            }
+        secondary_border_symbol_layer = self._build_secondary_border(
+            colors.secondary_color
         )
         line_symbol.appendSymbolLayer(secondary_border_symbol_layer)
 
-        priority_symbol_layer = self._create_priority_symbol_layer(self.priority)
-        marker_symbol = QgsMarkerSymbol()
-        marker_symbol.changeSymbolLayer(0, priority_symbol_layer)
-
         generator_layer = QgsGeometryGeneratorSymbolLayer.create({})
         generator_layer.setGeometryExpression(
             "line_interpolate_point( $geometry, length3D($geometry) / 2)"
         )
-        generator_layer.setSubSymbol(marker_symbol)
+        generator_layer.setSubSymbol(self._build_priority_marker_symbol())
 
         if not line_symbol.appendSymbolLayer(generator_layer):
             raise ValueError("invalid line symbol priority_symbol_layer")
@@ -314,6 +288,36 @@ class DefaultErrorSymbol(ErrorSymbol):
                     {"enabled": self.geometry_symbol_enabled_expression},
                 )
 
+    def _build_primary_border(
+        self, width_mm: float, color: Union[QColor, str]
+    ) -> QgsSimpleLineSymbolLayer:
+        return QgsSimpleLineSymbolLayer.create(
+            {
+                "line_color": self.color_to_rgba_string(color),
+                "line_width": str(width_mm),
+                "line_width_unit": "MM",
+            }
+        )
+
+    def _build_secondary_border(
+        self, color: Union[QColor, str]
+    ) -> QgsSimpleLineSymbolLayer:
+        return QgsSimpleLineSymbolLayer.create(
+            {
+                "line_color": self.color_to_rgba_string(color),
+                "line_width": "3.4",
+                "line_width_unit": "MM",
+                "joinstyle": "round",
+            }
+        )
+
+    def _build_priority_marker_symbol(self) -> QgsMarkerSymbol:
+        marker_symbol = QgsMarkerSymbol()
+        marker_symbol.changeSymbolLayer(
+            0, self._create_priority_symbol_layer(self.priority)
+        )
+        return marker_symbol
+
     def _create_priority_symbol_layer(
         self, priority: QualityErrorPriority
     ) -> QgsSvgMarkerSymbolLayer:
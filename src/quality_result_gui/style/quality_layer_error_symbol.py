@@ -18,6 +18,7 @@
 #  along with quality-result-gui. If not, see <https://www.gnu.org/licenses/>.
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Union
 
 from qgis.core import (
@@ -40,7 +41,9 @@ class BaseSymbol(ABC):
 
     @staticmethod
     def color_to_rgba_string(color: Union[str, QColor]) -> str:
-        return ",".join(map(str, QColor(color).getRgb()))
+        if isinstance(color, QColor):
+            return _rgba_to_rgba_string(color.rgba())
+        return _color_name_to_rgba_string(color)
 
 
 class ErrorSymbol(BaseSymbol, ABC):
@@ -66,3 +69,14 @@ class ErrorSymbol(BaseSymbol, ABC):
     @abstractmethod
     def _get_point_symbol(self, highlighted: bool) -> QgsMarkerSymbol:
         raise NotImplementedError()
+
+
+@lru_cache(maxsize=256)
+def _rgba_to_rgba_string(rgba: int) -> str:
+    red, green, blue, alpha = QColor.fromRgba(rgba).getRgb()
+    return f"{red},{green},{blue},{alpha}"
+
+
+@lru_cache(maxsize=256)
+def _color_name_to_rgba_string(color_name: str) -> str:
+    return _rgba_to_rgba_string(QColor(color_name).rgba())
@@ -17,11 +17,19 @@
 #  You should have received a copy of the GNU General Public License
 #  along with quality-result-gui. If not, see <https://www.gnu.org/licenses/>.
 
-from collections.abc import Generator
-from types import GeneratorType
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, Optional, cast
 
-from qgis.PyQt.QtCore import QAbstractItemModel, QModelIndex, Qt, QVariant, pyqtSignal
+from qgis.PyQt.QtCore import (
+    QAbstractItemModel,
+    QIdentityProxyModel,
+    QModelIndex,
+    QPersistentModelIndex,
+    Qt,
+    QTimer,
+    pyqtSignal,
+)
 from qgis.PyQt.QtWidgets import QTreeView, QWidget
 from qgis_plugin_tools.tools.decorations import log_if_fails
 
@@ -54,8 +62,8 @@ TREE_VIEW_STYLE = """
 class QualityErrorTreeView(QTreeView):
     quality_error_selected = pyqtSignal(QualityError, SelectionType)
 
-    errors_inserted = pyqtSignal(GeneratorType)
-    errors_removed = pyqtSignal(GeneratorType)
+    errors_inserted = pyqtSignal(list)
+    errors_removed = pyqtSignal(list)
 
     def __init__(
         self,
@@ -71,6 +79,31 @@ class QualityErrorTreeView(QTreeView):
 
         self.setStyleSheet(TREE_VIEW_STYLE)
 
+        # Expand inserted rows at most once per event loop turn
+        self._pending_expand_parents: set[QPersistentModelIndex] = set()
+        self._pending_expand_rows: set[QPersistentModelIndex] = set()
+        self._expand_timer = QTimer(self)
+        self._expand_timer.setSingleShot(True)
+        self._expand_timer.setInterval(0)
+        self._expand_timer.timeout.connect(self._flush_pending_expansions)
+
+        # Latest change of each error by unique identifier (error, inserted)
+        # while inside batch_error_changes
+        self._batched_error_changes: Optional[
+            dict[str, tuple[QualityError, bool]]
+        ] = None
+
+        # Emit selections caused by model changes at most once per event loop turn
+        self._pending_selection_index: Optional[QPersistentModelIndex] = None
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(0)
+        self._selection_timer.timeout.connect(self._emit_pending_selection)
+
+        # Unique identifier of the latest emitted selection, used to skip
+        # selecting the same error again when rows move during model updates
+        self._selected_error_id: Optional[str] = None
+
     def setModel(  # noqa: N802 (override qt method)
         self, model: Optional[QAbstractItemModel]
     ) -> None:
@@ -80,6 +113,9 @@ class QualityErrorTreeView(QTreeView):
 
         self.selectionModel().currentChanged.connect(self._on_current_item_changed)
 
+        # Row signals must stay direct connections, inserted row range is valid
+        # only during the signal and removed rows can be read only before the
+        # removal. Expanding the inserted rows is deferred separately.
         model.rowsInserted.connect(self._on_model_rows_inserted)
         model.rowsAboutToBeRemoved.connect(self._on_rows_about_to_be_removed)
 
@@ -107,63 +143,235 @@ class QualityErrorTreeView(QTreeView):
         self.current_selection_type = SelectionType.Other
 
     def get_all_quality_errors(self) -> list[QualityError]:
-        return [
-            error
-            for i in range(self.model().rowCount())
-            for error in self._get_quality_errors_from_index(self.model().index(i, 0))
-        ]
+        return self._collect_quality_errors_from_rows(
+            QModelIndex(), 0, self.model().rowCount() - 1
+        )
+
+    @contextmanager
+    def batch_error_changes(self) -> Iterator[None]:
+        """
+        Emits errors inserted to and removed from the view inside the block
+        once, when the block exits.
+
+        Only the latest change of each error is emitted, removed errors are
+        emitted before inserted ones.
+        """
+        if self._batched_error_changes is not None:
+            # Already batching in an outer block
+            yield
+            return
+
+        self._batched_error_changes = {}
+        try:
+            yield
+        finally:
+            changes = self._batched_error_changes
+            self._batched_error_changes = None
+
+            removed_errors = [
+                error for error, inserted in changes.values() if not inserted
+            ]
+            inserted_errors = [
+                error for error, inserted in changes.values() if inserted
+            ]
+            if removed_errors:
+                self.errors_removed.emit(removed_errors)
+            if inserted_errors:
+                self.errors_inserted.emit(inserted_errors)
+
+    def _emit_error_changes(
+        self, quality_errors: list[QualityError], inserted: bool
+    ) -> None:
+        if not quality_errors:
+            return
+
+        if self._batched_error_changes is not None:
+            for error in quality_errors:
+                self._batched_error_changes[error.unique_identifier] = (
+                    error,
+                    inserted,
+                )
+        elif inserted:
+            self.errors_inserted.emit(quality_errors)
+        else:
+            self.errors_removed.emit(quality_errors)
 
     def _on_model_rows_inserted(
         self, parent: QModelIndex, first: int, last: int
     ) -> None:
-        self.expandRecursively(parent)
+        self._schedule_expand_inserted_rows(parent, first, last)
 
-        for i in range(first, last + 1):
-            index = self.model().index(i, 0, parent)
+        # Update visualized errors once for the whole inserted range
+        new_errors_to_visualize = self._collect_quality_errors_from_rows(
+            parent, first, last
+        )
+        self._emit_error_changes(new_errors_to_visualize, inserted=True)
+
+    def _schedule_expand_inserted_rows(
+        self, parent: QModelIndex, first: int, last: int
+    ) -> None:
+        model = self.model()
+        if parent.isValid():
+            self._pending_expand_parents.add(QPersistentModelIndex(parent))
+        for row in range(first, last + 1):
+            index = model.index(row, 0, parent)
+            if model.hasChildren(index):
+                self._pending_expand_rows.add(QPersistentModelIndex(index))
+        self._expand_timer.start()
+
+    def _flush_pending_expansions(self) -> None:
+        """
+        Expands parents of the inserted rows and the inserted rows recursively.
 
-            # Update visualized errors
-            new_errors_to_visualize = self._get_quality_errors_from_index(index)
-            self.errors_inserted.emit(new_errors_to_visualize)
+        Only the inserted subtrees are walked, already expanded rows are not
+        expanded again when filters insert rows back to the model.
+        """
+        pending_parents = self._pending_expand_parents
+        pending_rows = self._pending_expand_rows
+        self._pending_expand_parents = set()
+        self._pending_expand_rows = set()
+
+        for persistent_index in pending_parents:
+            if persistent_index.isValid():
+                self.expand(QModelIndex(persistent_index))
+
+        for persistent_index in pending_rows:
+            if not persistent_index.isValid():
+                continue
+            index = QModelIndex(persistent_index)
+            # Expanding an inserted ancestor covers the row already
+            if not self._has_ancestor_in(index, pending_rows):
+                self.expandRecursively(index)
+
+    @staticmethod
+    def _has_ancestor_in(
+        index: QModelIndex, indexes: set[QPersistentModelIndex]
+    ) -> bool:
+        ancestor = index.parent()
+        while ancestor.isValid():
+            if QPersistentModelIndex(ancestor) in indexes:
+                return True
+            ancestor = ancestor.parent()
+        return False
 
     def _on_rows_about_to_be_removed(
         self, parent: QModelIndex, first: int, last: int
     ) -> None:
-        for i in range(first, last + 1):
-            index = self.model().index(i, 0, parent)
+        # Update visualized errors once for the whole removed range
+        errors_to_remove = self._collect_quality_errors_from_rows(parent, first, last)
+        self._emit_error_changes(errors_to_remove, inserted=False)
 
-            # Update visualized errors
-            errors_to_remove = self._get_quality_errors_from_index(index)
-            self.errors_removed.emit(errors_to_remove)
+        # Selection is visualized again if the removed error is selected later
+        if self._selected_error_id is not None and any(
+            error.unique_identifier == self._selected_error_id
+            for error in errors_to_remove
+        ):
+            self._selected_error_id = None
 
     @log_if_fails
     def _on_current_item_changed(
         self, current_index: QModelIndex, previous_index: QModelIndex
     ) -> None:
-        quality_error = self._get_quality_error_from_row(current_index)
+        if self.current_selection_type == SelectionType.Other:
+            # Current row may move many times while the model is updated
+            self._pending_selection_index = QPersistentModelIndex(current_index)
+            self._selection_timer.start()
+            return
 
-        if quality_error is None:
+        # Selections made by user are emitted right away
+        self._pending_selection_index = None
+        self._selection_timer.stop()
+        self._emit_quality_error_selected(current_index, self.current_selection_type)
+
+    @log_if_fails
+    def _emit_pending_selection(self) -> None:
+        if self._pending_selection_index is None:
             return
 
-        self.quality_error_selected.emit(quality_error, self.current_selection_type)
+        current_index = QModelIndex(self._pending_selection_index)
+        self._pending_selection_index = None
+        self._emit_quality_error_selected(current_index, SelectionType.Other)
 
-    def _get_quality_errors_from_index(
-        self, index: QModelIndex
-    ) -> Generator[QualityError, None, None]:
-        """Get quality errors recursively from index."""
+    def _emit_quality_error_selected(
+        self, index: QModelIndex, selection_type: SelectionType
+    ) -> None:
+        quality_error = self._get_quality_error_from_row(index)
 
-        if not index.isValid():
+        if quality_error is None:
             return
 
-        row_count = self.model().rowCount(index)
-        if row_count == 0:
-            # Index may now be at quality error row, which has never any children
-            error = self._get_quality_error_from_row(index)
-            if error is not None:
-                yield error
+        if (
+            selection_type == SelectionType.Other
+            and quality_error.unique_identifier == self._selected_error_id
+        ):
+            # Same error is already selected
             return
-        else:
-            for i in range(row_count):
-                yield from self._get_quality_errors_from_index(index.child(i, 0))
+
+        self.quality_error_selected.emit(quality_error, selection_type)
+        self._selected_error_id = quality_error.unique_identifier
+
+    def _map_to_collected_model(
+        self, index: QModelIndex
+    ) -> tuple[QAbstractItemModel, QModelIndex]:
+        """
+        Maps index of the view to the model quality errors are collected from.
+
+        Identity proxies have the same rows as their source, so errors are
+        collected below them without mapping each row through them.
+        """
+        model = self.model()
+        while isinstance(model, QIdentityProxyModel):
+            index = model.mapToSource(index)
+            model = model.sourceModel()
+        return model, index
+
+    def _collect_quality_errors_from_rows(
+        self, parent: QModelIndex, first: int, last: int
+    ) -> list[QualityError]:
+        """Get quality errors from rows first...last under parent."""
+
+        model, parent = self._map_to_collected_model(parent)
+        model_index = model.index
+        collect_quality_errors = self._collect_quality_errors
+        quality_errors: list[QualityError] = []
+        for i in range(first, last + 1):
+            quality_errors.extend(collect_quality_errors(model_index(i, 0, parent)))
+        return quality_errors
+
+    def _collect_quality_errors(self, index: QModelIndex) -> list[QualityError]:
+        """Get quality errors from index and all of its descendants."""
+
+        if not index.isValid():
+            return []
+
+        quality_errors: list[QualityError] = []
+        stack = [index]
+
+        # Bind lookups used for every visited row to locals
+        model = index.model()
+        model_index = model.index
+        row_count = model.rowCount
+        get_quality_error = self._get_quality_error_from_row
+        add_error = quality_errors.append
+        push = stack.extend
+        pop = stack.pop
+
+        while stack:
+            node = pop()
+            if not node.isValid():
+                continue
+
+            num_children = row_count(node)
+            if num_children == 0:
+                # Index may now be at quality error row, which has never any children
+                error = get_quality_error(node)
+                if error is not None:
+                    add_error(error)
+            else:
+                # Push children in reversed order to keep the original row order
+                push(model_index(i, 0, node) for i in reversed(range(num_children)))
+
+        return quality_errors
 
     def _get_quality_error_from_row(
         self,
@@ -171,7 +379,7 @@ class QualityErrorTreeView(QTreeView):
     ) -> Optional[QualityError]:
         data = row_index.data(Qt.UserRole)
 
-        if not QVariant(data).isValid():
+        if not isinstance(data, tuple):
             return None
 
         item_type, item_data = cast(ErrorDataType, data)
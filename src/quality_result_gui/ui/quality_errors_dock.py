@@ -18,12 +18,13 @@
 #  along with quality-result-gui. If not, see <https://www.gnu.org/licenses/>.
 
 import logging
+from functools import cache
 from typing import TYPE_CHECKING, Optional
 
 from qgis.core import QgsApplication
 from qgis.gui import QgsGui
-from qgis.PyQt.QtCore import pyqtSignal
-from qgis.PyQt.QtGui import QCloseEvent
+from qgis.PyQt.QtCore import pyqtSignal, pyqtSlot
+from qgis.PyQt.QtGui import QCloseEvent, QIcon
 from qgis.PyQt.QtWidgets import (
     QCheckBox,
     QDockWidget,
@@ -49,6 +50,12 @@ LOGGER = logging.getLogger(__name__)
 DockWidgetUi: type[QDockWidget] = load_ui_file(__package__, "quality_errors_dock.ui")
 
 
+@cache
+def _get_filter_icon() -> QIcon:
+    # QIcon is implicitly shared, the same icon can be set to every dock
+    return QgsApplication.getThemeIcon("/mActionFilter2.svg")
+
+
 class QualityErrorsDockWidget(DockWidgetUi):  # type: ignore[valid-type]
     """
     Graphical user interface for quality errors dock widget.
@@ -81,16 +88,15 @@ class QualityErrorsDockWidget(DockWidgetUi):  # type: ignore[valid-type]
         )
 
         self.filter_menu = QualityErrorsTreeFilterMenu(self)
-        self.filter_button.setIcon(QgsApplication.getThemeIcon("/mActionFilter2.svg"))
+        self.filter_button.setIcon(_get_filter_icon())
+        # No filters are added yet, so the button is left in its default up state
         self.filter_button.setMenu(self.filter_menu)
 
-        self._update_filter_menu_icon_state()
-
+    @pyqtSlot()
     def _update_filter_menu_icon_state(self) -> None:
-        if self.filter_menu.is_any_filter_active():
-            self.filter_button.setDown(True)
-        else:
-            self.filter_button.setDown(False)
+        is_any_filter_active = self.filter_menu.is_any_filter_active()
+        if self.filter_button.isDown() != is_any_filter_active:
+            self.filter_button.setDown(is_any_filter_active)
 
     def _register_shortcut(self) -> None:
         QgsGui.shortcutsManager().registerShortcut(
@@ -19,13 +19,13 @@
 
 
 import logging
-from typing import TYPE_CHECKING, Optional
+from typing import Optional
 
+from qgis.PyQt.QtCore import pyqtSlot
 from qgis.PyQt.QtWidgets import QAction, QMenu, QWidget
 from qgis_plugin_tools.tools.i18n import tr
 
-if TYPE_CHECKING:
-    from quality_result_gui.quality_errors_filters import FilterMenu
+from quality_result_gui.quality_errors_filters import FilterMenu
 
 LOGGER = logging.getLogger(__name__)
 
@@ -43,8 +43,11 @@ class QualityErrorsTreeFilterMenu(QMenu):
         self.reset_separator = self.addSeparator()
         self.reset_action = QAction(tr("Reset filters"), self)
         self.addAction(self.reset_action)
+        self.reset_action.triggered.connect(self._reset_filter_menus)
 
-    def add_filter_menu(self, menu: "FilterMenu") -> None:
+        self._filter_menus: list[FilterMenu] = []
+
+    def add_filter_menu(self, menu: FilterMenu) -> None:
         """Adds a menu into this menu as a sub menu
 
         Args:
@@ -52,12 +55,19 @@ class QualityErrorsTreeFilterMenu(QMenu):
         """
 
         self.insertMenu(self.reset_separator, menu)  # insert before the separator
-        self.reset_action.triggered.connect(menu._select_all)
+        self._filter_menus.append(menu)
+
+    @pyqtSlot()
+    def _reset_filter_menus(self) -> None:
+        for menu in self._filter_menus:
+            if menu.is_any_filter_active():
+                menu._select_all()
 
     def is_any_filter_active(self, menu: Optional[QMenu] = None) -> bool:
         """Checks if any of menu's checkbox are unchecked
 
-        Recursively travels the menu and its submenus to check if any filter is active
+        Recursively travels the menu and its submenus to check if any filter is active.
+        Filter menus keep count of their unchecked actions and are not travelled.
 
         Args:
             parent (Optional[QMenu], optional): Menu to be checked for. If None, checks
@@ -73,6 +83,9 @@ class QualityErrorsTreeFilterMenu(QMenu):
             if action.isCheckable() and action.isChecked() is False:
                 return True
             sub_menu = action.menu()
-            if sub_menu and self.is_any_filter_active(sub_menu):
+            if isinstance(sub_menu, FilterMenu):
+                if sub_menu.is_any_filter_active():
+                    return True
+            elif sub_menu and self.is_any_filter_active(sub_menu):
                 return True
         return False
@@ -17,7 +17,7 @@
 #  You should have received a copy of the GNU General Public License
 #  along with quality-result-gui. If not, see <https://www.gnu.org/licenses/>.
 
-from typing import Optional
+from typing import Optional, Union
 
 from qgis.core import (
     QgsCoordinateReferenceSystem,
@@ -55,41 +55,63 @@ def zoom_to_geometries_and_flash(
     if view_extent is None:
         return
 
-    if crs != QgsProject.instance().crs():
-        view_extent = transform_bounding_box(
-            view_extent, crs, QgsProject.instance().crs()
-        )
-    # Only move canvas
-    if preserve_scale is True:
-        iface.mapCanvas().setCenter(view_extent.center())
-    # Move canvas and zoom to geometries
-    else:
-        if min_extent_height is not None and view_extent.height() < min_extent_height:
-            view_extent = (
-                QgsGeometry.fromPointXY(view_extent.center())
-                .buffer(min_extent_height / 2, 1)
-                .boundingBox()
-            )
-        iface.mapCanvas().setExtent(view_extent)
-    iface.mapCanvas().flashGeometries(geometries, crs)
-    iface.mapCanvas().redrawAllLayers()
+    project_crs = QgsProject.instance().crs()
+    if not _is_same_crs(crs, project_crs):
+        view_extent = transform_bounding_box(view_extent, crs, project_crs)
+
+    canvas = iface.mapCanvas()
+    # Render the canvas only once with the redraw below
+    canvas.freeze(True)
+    try:
+        # Only move canvas
+        if preserve_scale is True:
+            canvas.setCenter(view_extent.center())
+        # Move canvas and zoom to geometries
+        else:
+            if (
+                min_extent_height is not None
+                and view_extent.height() < min_extent_height
+            ):
+                view_extent = (
+                    QgsGeometry.fromPointXY(view_extent.center())
+                    .buffer(min_extent_height / 2, 1)
+                    .boundingBox()
+                )
+            canvas.setExtent(view_extent)
+    finally:
+        canvas.freeze(False)
+    canvas.flashGeometries(geometries, crs)
+    canvas.redrawAllLayers()
+
+
+def _is_same_crs(
+    crs: QgsCoordinateReferenceSystem, other_crs: QgsCoordinateReferenceSystem
+) -> bool:
+    # Compare authority ids first to skip the full crs comparison in most cases
+    authid = crs.authid()
+    if authid and authid == other_crs.authid():
+        return True
+    return crs == other_crs
 
 
 def get_extent_from_geometries(geometries: list[QgsGeometry]) -> Optional[QgsRectangle]:
     if len(geometries) == 0:
         return None
 
-    view_extent = geometries[0].buffer(BOUNDING_BOX_BUFFER_COEFFICIENT, 2).boundingBox()
-    for geometry in geometries:
-        view_extent.combineExtentWith(geometry.boundingBox())
+    # Grow the first bounding box instead of buffering the geometry itself,
+    # a point still results in a non-empty extent
+    view_extent = geometries[0].boundingBox().buffered(BOUNDING_BOX_BUFFER_COEFFICIENT)
+    combine_extent_with = view_extent.combineExtentWith
+    for geometry in geometries[1:]:
+        combine_extent_with(geometry.boundingBox())
 
     return view_extent.buffered(view_extent.height() * BOUNDING_BOX_BUFFER_COEFFICIENT)
 
 
 def transform_bounding_box(
     rectangle: QgsRectangle,
-    crs: str,
-    target_crs: str,
+    crs: Union[str, QgsCoordinateReferenceSystem],
+    target_crs: Union[str, QgsCoordinateReferenceSystem],
 ) -> QgsRectangle:
     """
     Transform bounding box from one crs to other.
@@ -29,6 +29,8 @@ from qgis.core import (
 )
 from qgis.PyQt.QtGui import QColor
 
+_PROPERTY_NAME_TO_NUMBER_MAPPINGS: dict[type[QgsSymbolLayer], dict[str, int]] = {}
+
 
 def set_symbol_layer_data_defined_property_expressions(
     symbol_layer: QgsSymbolLayer, data_defined_property_expressions: dict[str, str]
@@ -40,10 +42,7 @@ def set_symbol_layer_data_defined_property_expressions(
     """
     data_defined_properties = QgsPropertyCollection()
 
-    property_name_to_number_mapping = {
-        definition.name(): number
-        for number, definition in symbol_layer.propertyDefinitions().items()
-    }
+    property_name_to_number_mapping = _get_property_name_to_number_mapping(symbol_layer)
 
     for property_name, property_expression in data_defined_property_expressions.items():
         property = QgsProperty.fromExpression(property_expression)
@@ -55,6 +54,21 @@ def set_symbol_layer_data_defined_property_expressions(
     symbol_layer.setDataDefinedProperties(data_defined_properties)
 
 
+def _get_property_name_to_number_mapping(
+    symbol_layer: QgsSymbolLayer,
+) -> dict[str, int]:
+    # Property definitions are static for a symbol layer class
+    symbol_layer_class = type(symbol_layer)
+    mapping = _PROPERTY_NAME_TO_NUMBER_MAPPINGS.get(symbol_layer_class)
+    if mapping is None:
+        mapping = {
+            definition.name(): number
+            for number, definition in symbol_layer.propertyDefinitions().items()
+        }
+        _PROPERTY_NAME_TO_NUMBER_MAPPINGS[symbol_layer_class] = mapping
+    return mapping
+
+
 def set_symbol_layer_simple_outer_glow_effect(
     symbol_layer: QgsSymbolLayer,
     color_rgba: str,
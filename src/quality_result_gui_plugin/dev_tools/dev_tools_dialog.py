@@ -23,6 +23,7 @@ from typing import Optional
 
 from qgis.gui import QgsFileWidget
 from qgis.PyQt import uic
+from qgis.PyQt.QtCore import pyqtSlot
 from qgis.PyQt.QtWidgets import QDialog, QDialogButtonBox, QPushButton, QWidget
 
 FORM_CLASS: QWidget
@@ -30,6 +31,9 @@ FORM_CLASS, _ = uic.loadUiType(
     str(Path(__file__).parent.joinpath("dev_tools_dialog.ui"))
 )
 
+EXAMPLE_QUALITY_ERRORS_DIR = str(
+    (Path(__file__).parent / "example_quality_errors").resolve()
+)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -45,9 +49,7 @@ class DevToolsDialog(QDialog, FORM_CLASS):
         self.setupUi(self)
 
         # Setup for quality errors dialog:
-        self.quality_errors_data_file_widget.setDefaultRoot(
-            str((Path(__file__).parent / "example_quality_errors").resolve())
-        )
+        self.quality_errors_data_file_widget.setDefaultRoot(EXAMPLE_QUALITY_ERRORS_DIR)
         self.quality_errors_data_file_widget.setFilter("*.json")
         self.quality_errors_data_file_widget.fileChanged.connect(
             self._enable_open_quality_errors_dialog_button
@@ -55,5 +57,7 @@ class DevToolsDialog(QDialog, FORM_CLASS):
         self.btn_open_quality_errors_dialog.setEnabled(False)
         self.btn_open_quality_errors_dialog.clicked.connect(self.accept)
 
+    @pyqtSlot()
     def _enable_open_quality_errors_dialog_button(self) -> None:
-        self.btn_open_quality_errors_dialog.setEnabled(True)
+        if not self.btn_open_quality_errors_dialog.isEnabled():
+            self.btn_open_quality_errors_dialog.setEnabled(True)
@@ -17,21 +17,27 @@
 #  You should have received a copy of the GNU General Public License
 #  along with quality-result-gui. If not, see <https://www.gnu.org/licenses/>.
 
-import json
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 from qgis.core import QgsCoordinateReferenceSystem
 from quality_result_gui.api.quality_api_client import QualityResultClient
 from quality_result_gui.api.types.quality_error import QualityError
 
-from quality_result_gui_plugin.dev_tools.response_parser import QualityErrorResponse
+from quality_result_gui_plugin.dev_tools.response_parser import parse_quality_errors
 
 
 @dataclass
 class MockQualityResultClient(QualityResultClient):
-    json_file_path: Path
+    json_file_path: Union[str, Path]
+    _quality_errors: Optional[list[QualityError]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _quality_errors_file_signature: Optional[tuple[int, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def get_results(self) -> Optional[list[QualityError]]:
         """
@@ -45,9 +51,22 @@ class MockQualityResultClient(QualityResultClient):
             QualityResultClientError: if request fails
             QualityResultServerError: if check failed in backend
         """
-        return QualityErrorResponse(
-            json.loads(self.json_file_path.read_text())
-        ).quality_results
+        return list(self._read_quality_errors())
+
+    def _read_quality_errors(self) -> list[QualityError]:
+        """Parses the json file, reusing the previous result if file is unchanged"""
+
+        with open(self.json_file_path, "rb") as json_file:
+            stat = os.fstat(json_file.fileno())
+            file_signature = (stat.st_mtime_ns, stat.st_size)
+            if (
+                self._quality_errors is None
+                or file_signature != self._quality_errors_file_signature
+            ):
+                # json accepts bytes directly, no need to decode the file first
+                self._quality_errors = parse_quality_errors(json_file.read())
+                self._quality_errors_file_signature = file_signature
+        return self._quality_errors
 
     def get_crs(self) -> QgsCoordinateReferenceSystem:
         return QgsCoordinateReferenceSystem("EPSG:3067")
@@ -17,7 +17,9 @@
 #  You should have received a copy of the GNU General Public License
 #  along with quality-result-gui. If not, see <https://www.gnu.org/licenses/>.
 
-from dataclasses import dataclass, field
+import json
+import sys
+from operator import itemgetter
 from typing import Any
 
 from qgis.core import QgsGeometry
@@ -27,26 +29,71 @@ from quality_result_gui.api.types.quality_error import (
     QualityErrorType,
 )
 
+# Plain dict lookups are cheaper than calling the enum classes for every error
+_PRIORITIES_BY_VALUE = {priority.value: priority for priority in QualityErrorPriority}
+_ERROR_TYPES_BY_VALUE = {
+    error_type.value: error_type for error_type in QualityErrorType
+}
 
-@dataclass
-class QualityErrorResponse:
-    quality_results: list[QualityError] = field(init=False)
-    _errors_obj: list[dict[str, Any]]
-
-    def __post_init__(self) -> None:
-        self.quality_results = [
-            QualityError(
-                priority=QualityErrorPriority(error_obj["priority"]),
-                feature_type=error_obj["feature_type"],
-                feature_id=error_obj["feature_id"],
-                error_id=error_obj["error_id"],
-                unique_identifier=error_obj["unique_identifier"],
-                error_type=QualityErrorType(error_obj["error_type"]),
-                attribute_name=error_obj["attribute_name"],
-                error_description=error_obj["error_description"],
-                error_extra_info=error_obj.get("extra_info", None),
-                geometry=QgsGeometry.fromWkt(error_obj["wkt_geom"]),
-                is_user_processed=error_obj["is_user_processed"],
-            )
-            for error_obj in self._errors_obj
-        ]
+# Fetches all the required fields of an error object with a single call
+_get_required_error_fields = itemgetter(
+    "priority",
+    "feature_type",
+    "feature_id",
+    "error_id",
+    "unique_identifier",
+    "error_type",
+    "attribute_name",
+    "error_description",
+    "wkt_geom",
+    "is_user_processed",
+)
+
+
+def parse_quality_errors(payload: bytes) -> list[QualityError]:
+    """Parses quality errors from json.
+
+    Errors are built while the json is decoded, without keeping a list of the
+    decoded error dicts alive.
+    """
+
+    return json.loads(payload, object_hook=_quality_error_object_hook)
+
+
+def _quality_error_object_hook(obj: dict[str, Any]) -> Any:  # noqa: ANN401
+    # Nested objects such as extra info are left as dicts
+    if "unique_identifier" in obj and "wkt_geom" in obj:
+        return _quality_error_from_obj(obj)
+    return obj
+
+
+def _quality_error_from_obj(error_obj: dict[str, Any]) -> QualityError:
+    (
+        priority,
+        feature_type,
+        feature_id,
+        error_id,
+        unique_identifier,
+        error_type,
+        attribute_name,
+        error_description,
+        wkt_geom,
+        is_user_processed,
+    ) = _get_required_error_fields(error_obj)
+
+    return QualityError(
+        priority=_PRIORITIES_BY_VALUE[priority],
+        # Few distinct feature types and attribute names repeat across errors
+        feature_type=sys.intern(feature_type),
+        feature_id=feature_id,
+        error_id=error_id,
+        unique_identifier=unique_identifier,
+        error_type=_ERROR_TYPES_BY_VALUE[error_type],
+        attribute_name=(
+            sys.intern(attribute_name) if attribute_name is not None else None
+        ),
+        error_description=error_description,
+        error_extra_info=error_obj.get("extra_info"),
+        geometry=QgsGeometry.fromWkt(wkt_geom),
+        is_user_processed=is_user_processed,
+    )
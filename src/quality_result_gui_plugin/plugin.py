@@ -19,70 +19,74 @@
 
 import logging
 from pathlib import Path
-from typing import Optional, cast
+from typing import TYPE_CHECKING, Optional, cast
 
 import qgis_plugin_tools
 import quality_result_gui
+from qgis import utils as qgis_utils
 from qgis.core import QgsApplication, QgsProject
 from qgis.gui import QgisInterface
 from qgis.PyQt.QtCore import QCoreApplication, Qt, QTranslator
 from qgis.PyQt.QtGui import QIcon
 from qgis.PyQt.QtWidgets import QAction
-from qgis.utils import iface as utils_iface
 from qgis_plugin_tools.tools.custom_logging import setup_loggers
 from qgis_plugin_tools.tools.i18n import setup_translation, tr
 from qgis_plugin_tools.tools.resources import resources_path
 from quality_result_gui import env
-from quality_result_gui.quality_error_manager import QualityResultManager
 
 import quality_result_gui_plugin
-from quality_result_gui_plugin.dev_tools.dev_tools_dialog import DevToolsDialog
-from quality_result_gui_plugin.dev_tools.mock_api_client import MockQualityResultClient
 
-LOGGER = logging.getLogger(__name__)
+# Modules loading .ui files are imported only when needed to keep QGIS startup fast
+if TYPE_CHECKING:
+    from quality_result_gui.quality_error_manager import QualityResultManager
+
+    from quality_result_gui_plugin.dev_tools.dev_tools_dialog import DevToolsDialog
 
-iface = cast(QgisInterface, utils_iface)
+LOGGER = logging.getLogger(__name__)
 
 
 class QualityResultGuiPlugin:
     def __init__(self) -> None:
         self._teardown_loggers = lambda: None
 
-        self.quality_error_manager: Optional[QualityResultManager] = None
+        self.quality_error_manager: Optional["QualityResultManager"] = None
 
-        # Initialize locale
-        _, file_path = setup_translation()
-        if file_path:
-            self.translator = QTranslator()
-            self.translator.load(file_path)
-            QCoreApplication.installTranslator(self.translator)
-
-        self._menu_name = tr("Quality result GUI")
+        # Translations are set up in initGui, not when QGIS loads the plugin
+        self.translator: Optional[QTranslator] = None
+        self._is_translation_set_up = False
+        self._menu_name = ""
 
         self.show_dev_tools_dialog_action: Optional[QAction] = None
-        self.dev_tools_dialog: Optional[DevToolsDialog] = None
+        self.dev_tools_dialog: Optional["DevToolsDialog"] = None
         self.dev_tool_action: Optional[QAction] = None
         self._test_json_file_path = ""
 
+    @property
+    def _iface(self) -> QgisInterface:
+        # Read on use, qgis.utils.iface may not be set yet when this module is imported
+        return cast(QgisInterface, qgis_utils.iface)
+
     def initGui(self) -> None:  # noqa: N802 (qgis naming)
+        self._setup_translation()
+
         self._teardown_loggers = setup_loggers(
             quality_result_gui.__name__,
             quality_result_gui_plugin.__name__,
             qgis_plugin_tools.__name__,
-            message_log_name=tr("Quality result GUI"),
+            message_log_name=self._menu_name,
         )
 
         # Add action to show dev tools dialog to menu
         self.show_dev_tools_dialog_action = QAction(
             QgsApplication.getThemeIcon("/propertyicons/settings.svg"),
             tr("Development tools"),
-            iface.mainWindow(),
+            self._iface.mainWindow(),
         )
         self.show_dev_tools_dialog_action.triggered.connect(
             self._on_open_dev_tools_called
         )
 
-        iface.addPluginToMenu(self._menu_name, self.show_dev_tools_dialog_action)
+        self._iface.addPluginToMenu(self._menu_name, self.show_dev_tools_dialog_action)
 
         # Add shortcut action to open qulity results form example json when in dev mode
         if env.IS_DEVELOPMENT_MODE and self.dev_tool_action is None:
@@ -100,15 +104,29 @@ class QualityResultGuiPlugin:
             self.dev_tool_action = QAction(
                 QIcon(resources_path("icons/quality_result_gui.svg")),
                 "Test quality result GUI",
-                iface.mainWindow(),
+                self._iface.mainWindow(),
             )
             self.dev_tool_action.triggered.connect(
                 self._toggle_quality_result_gui_in_dev_mode
             )
-            iface.addToolBarIcon(self.dev_tool_action)
+            self._iface.addToolBarIcon(self.dev_tool_action)
+
+    def _setup_translation(self) -> None:
+        if self._is_translation_set_up:
+            return
+
+        # Initialize locale
+        _, file_path = setup_translation()
+        if file_path:
+            self.translator = QTranslator()
+            self.translator.load(file_path)
+            QCoreApplication.installTranslator(self.translator)
+
+        self._menu_name = tr("Quality result GUI")
+        self._is_translation_set_up = True
 
     def unload(self) -> None:
-        iface.removePluginMenu(self._menu_name, self.show_dev_tools_dialog_action)
+        self._iface.removePluginMenu(self._menu_name, self.show_dev_tools_dialog_action)
 
         self._unload_quality_error_manager_if_exists()
 
@@ -116,17 +134,29 @@ class QualityResultGuiPlugin:
         self._teardown_loggers = lambda: None
 
         if self.dev_tool_action:
-            iface.removeToolBarIcon(self.dev_tool_action)
+            self._iface.removeToolBarIcon(self.dev_tool_action)
+
+        if self.dev_tools_dialog:
+            self.dev_tools_dialog.deleteLater()
+            self.dev_tools_dialog = None
 
     def _unload_quality_error_manager_if_exists(self) -> None:
         if self.quality_error_manager:
-            iface.removeDockWidget(self.quality_error_manager.dock_widget)
+            self._iface.removeDockWidget(self.quality_error_manager.dock_widget)
 
             self.quality_error_manager.unload()
             self.quality_error_manager = None
 
     def _on_open_dev_tools_called(self) -> None:
-        dialog = DevToolsDialog(iface.mainWindow())
+        from quality_result_gui_plugin.dev_tools.dev_tools_dialog import (
+            DevToolsDialog,
+        )
+
+        # Reuse the dialog, it keeps the previously selected file
+        if self.dev_tools_dialog is None:
+            self.dev_tools_dialog = DevToolsDialog(self._iface.mainWindow())
+
+        dialog = self.dev_tools_dialog
         if dialog.exec_():
             self._test_json_file_path = (
                 dialog.quality_errors_data_file_widget.filePath()
@@ -143,18 +173,30 @@ class QualityResultGuiPlugin:
             self.quality_error_manager.show_dock_widget()
 
     def _create_quality_result_gui_in_dev_mode(self) -> None:
-        api_client = MockQualityResultClient(Path(self._test_json_file_path))
+        from quality_result_gui.quality_error_manager import QualityResultManager
+
+        from quality_result_gui_plugin.dev_tools.mock_api_client import (
+            MockQualityResultClient,
+        )
+
+        api_client = MockQualityResultClient(self._test_json_file_path)
         QgsProject.instance().setCrs(api_client.get_crs())
 
         self.quality_error_manager = QualityResultManager(
-            api_client, iface.mainWindow()
+            api_client, self._iface.mainWindow()
         )
         self.quality_error_manager.closed.connect(
             self.quality_error_manager.hide_dock_widget
         )
 
-        iface.addDockWidget(
-            Qt.DockWidgetArea.RightDockWidgetArea,
-            self.quality_error_manager.dock_widget,
-        )
-        self.quality_error_manager.show_dock_widget()
+        # Lay out and repaint the main window once after the dock is attached
+        main_window = self._iface.mainWindow()
+        main_window.setUpdatesEnabled(False)
+        try:
+            self._iface.addDockWidget(
+                Qt.DockWidgetArea.RightDockWidgetArea,
+                self.quality_error_manager.dock_widget,
+            )
+            self.quality_error_manager.show_dock_widget()
+        finally:
+            main_window.setUpdatesEnabled(True)
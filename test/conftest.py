@@ -17,11 +17,18 @@
 #  You should have received a copy of the GNU General Public License
 #  along with quality-result-gui. If not, see <https://www.gnu.org/licenses/>.
 
+from collections.abc import Generator
+from dataclasses import replace
 from typing import Any, Callable, Optional
+from unittest.mock import patch
 
 import pytest
-from pytest_mock import MockerFixture
-from qgis.core import QgsCoordinateReferenceSystem, QgsGeometry
+from qgis.core import (
+    QgsCoordinateReferenceSystem,
+    QgsGeometry,
+    QgsPointXY,
+    QgsRectangle,
+)
 from qgis.PyQt.QtWidgets import QAction, QMenu
 from qgis_plugin_tools.tools.messages import MsgBar
 from quality_result_gui.api.quality_api_client import QualityResultClient
@@ -33,20 +40,24 @@ from quality_result_gui.api.types.quality_error import (
 
 
 class MockQualityResultClient(QualityResultClient):
+    def __init__(self) -> None:
+        self._crs = QgsCoordinateReferenceSystem("EPSG:3067")
+
     def get_results(self) -> Optional[list[QualityError]]:
         return []
 
     def get_crs(self) -> QgsCoordinateReferenceSystem:
-        return QgsCoordinateReferenceSystem("EPSG:3067")
+        # Copies share the crs data looked up once per client
+        return QgsCoordinateReferenceSystem(self._crs)
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def mock_api_client() -> QualityResultClient:
     return MockQualityResultClient()
 
 
-@pytest.fixture()
-def _bypass_log_if_fails(mocker: MockerFixture) -> None:
+@pytest.fixture(scope="session", autouse=True)
+def _bypass_log_if_fails() -> Generator[None, None, None]:
     """Throws unhandled exception even though it is caught with log_if_fails"""
 
     def mock_msg_bar(*args: Any, **kwargs: Any):
@@ -59,11 +70,13 @@ def _bypass_log_if_fails(mocker: MockerFixture) -> None:
         ):
             raise e
 
-    mocker.patch.object(MsgBar, "exception", mock_msg_bar)
+    # Stateless patch, applied once for the whole session
+    with patch.object(MsgBar, "exception", mock_msg_bar):
+        yield
 
 
-@pytest.fixture()
-def quality_errors() -> list[QualityError]:
+@pytest.fixture(scope="session")
+def quality_errors_template() -> list[QualityError]:
     return [
         QualityError(
             QualityErrorPriority.FATAL,
@@ -75,7 +88,7 @@ def quality_errors() -> list[QualityError]:
             None,
             "Invalid geometry",
             "Extra info",
-            QgsGeometry.fromWkt("POINT ((5 5))"),
+            QgsGeometry.fromPointXY(QgsPointXY(5, 5)),
             False,
         ),
         QualityError(
@@ -88,7 +101,7 @@ def quality_errors() -> list[QualityError]:
             "vtj_prt",
             "Invalid value",
             "Extra info",
-            QgsGeometry.fromWkt("POLYGON((0 0, 0 5, 5 5, 5 0, 0 0))"),
+            QgsGeometry.fromRect(QgsRectangle(0, 0, 5, 5)),
             True,
         ),
         QualityError(
@@ -101,7 +114,7 @@ def quality_errors() -> list[QualityError]:
             "height_absolute",
             "Invalidvalue",
             "Extra info",
-            QgsGeometry.fromWkt("POLYGON((10 10, 10 15, 15 15, 15 10, 10 10))"),
+            QgsGeometry.fromRect(QgsRectangle(10, 10, 15, 15)),
             False,
         ),
         QualityError(
@@ -114,7 +127,7 @@ def quality_errors() -> list[QualityError]:
             "height_relative",
             "Invalid value",
             "Extra info",
-            QgsGeometry.fromWkt("POLYGON((20 20, 20 25, 25 25, 25 20, 20 20))"),
+            QgsGeometry.fromRect(QgsRectangle(20, 20, 25, 25)),
             False,
         ),
         QualityError(
@@ -127,19 +140,30 @@ def quality_errors() -> list[QualityError]:
             "floors_above_ground",
             "Missing value",
             "Extra info",
-            QgsGeometry.fromWkt("POLYGON((30 30, 30 35, 35 35, 35 30, 30 30))"),
+            QgsGeometry.fromRect(QgsRectangle(30, 30, 35, 35)),
             False,
         ),
     ]
 
 
 @pytest.fixture()
+def quality_errors(
+    quality_errors_template: list[QualityError],
+) -> list[QualityError]:
+    # Tests modify the errors, give each test own copies of the session errors
+    return [
+        replace(error, geometry=QgsGeometry(error.geometry))
+        for error in quality_errors_template
+    ]
+
+
+@pytest.fixture(scope="session")
 def error_feature_types() -> list[str]:
     """Unique feature types in quality_errors fixture"""
     return ["building_part_area", "chimney_point"]
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def error_feature_attributes() -> list[str]:
     """Unique feature types in quality_errors fixture"""
     return [
@@ -163,7 +187,7 @@ def single_quality_error() -> list[QualityError]:
             None,
             "Invalid geometry",
             "Extra info",
-            QgsGeometry.fromWkt("POINT ((5 5))"),
+            QgsGeometry.fromPointXY(QgsPointXY(5, 5)),
             False,
         ),
     ]
@@ -172,15 +196,15 @@ def single_quality_error() -> list[QualityError]:
 @pytest.fixture()
 def get_submenu_from_menu() -> Callable[[QMenu, str], Optional[QMenu]]:
     def _get_submenu_from_menu(menu: QMenu, menu_title: str) -> Optional[QMenu]:
-        menu_items = [
-            action.menu()
-            for action in menu.actions()
-            if action.menu() is not None and action.menu().title() == menu_title
-        ]
-
-        if len(menu_items) == 1:
-            return menu_items[0]
-        return None
+        found_menu = None
+        for action in menu.actions():
+            sub_menu = action.menu()
+            if sub_menu is not None and sub_menu.title() == menu_title:
+                if found_menu is not None:
+                    # Ambiguous title
+                    return None
+                found_menu = sub_menu
+        return found_menu
 
     return _get_submenu_from_menu
 
@@ -197,36 +221,33 @@ def get_checked_menu_items() -> Callable[[QMenu], list[str]]:
     return _get_checked_menu_items
 
 
-@pytest.fixture()
-def get_action_from_menu() -> Callable[[QMenu, str], Optional[QAction]]:
-    def _get_action_from_menu(menu: QMenu, action_title: str) -> Optional[QAction]:
-        action_items = [
-            action for action in menu.actions() if action_title == action.text()
-        ]
+def _get_action_from_menu(menu: QMenu, action_title: str) -> Optional[QAction]:
+    action_items = [
+        action for action in menu.actions() if action_title == action.text()
+    ]
+
+    if len(action_items) == 1:
+        return action_items[0]
+    return None
 
-        if len(action_items) == 1:
-            return action_items[0]
-        return None
 
+@pytest.fixture()
+def get_action_from_menu() -> Callable[[QMenu, str], Optional[QAction]]:
     return _get_action_from_menu
 
 
 @pytest.fixture()
-def is_action_present(
-    get_action_from_menu: Callable[[QMenu, str], Optional[QAction]]
-) -> Callable[[QMenu, str], bool]:
+def is_action_present() -> Callable[[QMenu, str], bool]:
     def _is_action_present(menu: QMenu, action_title: str) -> bool:
-        return bool(get_action_from_menu(menu, action_title))
+        return _get_action_from_menu(menu, action_title) is not None
 
     return _is_action_present
 
 
 @pytest.fixture()
-def trigger_action(
-    get_action_from_menu: Callable[[QMenu, str], Optional[QAction]]
-) -> Callable[[QMenu, str], None]:
+def trigger_action() -> Callable[[QMenu, str], None]:
     def _trigger_action(menu: QMenu, action_title: str) -> None:
-        action = get_action_from_menu(menu, action_title)
+        action = _get_action_from_menu(menu, action_title)
         assert (
             action is not None
         ), f"Could not find action for menu title: {action_title}"
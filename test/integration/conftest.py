@@ -21,14 +21,13 @@ from collections.abc import Generator
 from typing import TYPE_CHECKING
 
 import pytest
-from pytestqt.qtbot import QtBot
 from qgis.core import QgsField, QgsProject, QgsVectorLayer, edit
 from qgis.PyQt.QtCore import QVariant
+from quality_result_gui.quality_error_manager import QualityResultManager
 
 if TYPE_CHECKING:
     from quality_result_gui.api.quality_api_client import QualityResultClient
     from quality_result_gui.api.types.quality_error import QualityError
-    from quality_result_gui.quality_error_manager import QualityResultManager
     from quality_result_gui.ui.quality_errors_tree_filter_menu import (
         QualityErrorsTreeFilterMenu,
     )
@@ -37,15 +36,11 @@ if TYPE_CHECKING:
 @pytest.fixture()
 def quality_result_manager(
     qgis_new_project: None,
-    _bypass_log_if_fails: None,
-    qtbot: QtBot,
     mock_api_client: "QualityResultClient",
     monkeypatch: pytest.MonkeyPatch,
-) -> Generator["QualityResultManager", None, None]:
-    from quality_result_gui.quality_error_manager import QualityResultManager
-
+) -> Generator[QualityResultManager, None, None]:
+    # unload closes and deletes the dock widget
     manager = QualityResultManager(mock_api_client, None)
-    qtbot.addWidget(manager.dock_widget)
 
     monkeypatch.setenv("IS_DEVELOPMENT_MODE", "f")
     manager.dock_widget.show()
@@ -56,25 +51,20 @@ def quality_result_manager(
 
 @pytest.fixture()
 def quality_result_manager_with_data(
-    quality_result_manager: "QualityResultManager",
+    quality_result_manager: QualityResultManager,
     quality_errors: list["QualityError"],
-    qtbot: QtBot,
-) -> "QualityResultManager":
-    with qtbot.waitSignal(
-        quality_result_manager._base_model.filterable_data_changed,
-        timeout=200,
-    ) as _:
-        quality_result_manager._fetcher.results_received.emit(quality_errors)
+) -> QualityResultManager:
+    # Direct connections, model is refreshed synchronously on emit
+    quality_result_manager._fetcher.results_received.emit(quality_errors)
 
     return quality_result_manager
 
 
 @pytest.fixture()
 def quality_result_manager_with_data_and_layer_mapping(
-    quality_result_manager: "QualityResultManager",
+    quality_result_manager: QualityResultManager,
     quality_errors: list["QualityError"],
-    qtbot: QtBot,
-) -> Generator["QualityResultManager", None, None]:
+) -> Generator[QualityResultManager, None, None]:
     layer = QgsVectorLayer("NoGeometry", "mock", "memory")
     with edit(layer):
         field = QgsField("height_relative", QVariant.String)
@@ -83,11 +73,8 @@ def quality_result_manager_with_data_and_layer_mapping(
         layer.dataProvider().addAttributes([field])
     QgsProject.instance().addMapLayer(layer, False)
     quality_result_manager.set_layer_mapping({"chimney_point": layer.id()})
-    with qtbot.waitSignal(
-        quality_result_manager._base_model.filterable_data_changed,
-        timeout=200,
-    ) as _:
-        quality_result_manager._fetcher.results_received.emit(quality_errors)
+    # Direct connections, model is refreshed synchronously on emit
+    quality_result_manager._fetcher.results_received.emit(quality_errors)
 
     yield quality_result_manager
     quality_result_manager.set_layer_mapping({})
@@ -96,6 +83,6 @@ def quality_result_manager_with_data_and_layer_mapping(
 
 @pytest.fixture()
 def filter_menu_with_chimney_point_alias(
-    quality_result_manager_with_data_and_layer_mapping: "QualityResultManager",
+    quality_result_manager_with_data_and_layer_mapping: QualityResultManager,
 ) -> "QualityErrorsTreeFilterMenu":
     return quality_result_manager_with_data_and_layer_mapping.dock_widget.filter_menu
@@ -17,8 +17,11 @@
 #  You should have received a copy of the GNU General Public License
 #  along with quality-result-gui. If not, see <https://www.gnu.org/licenses/>.
 
+from functools import cache
+
 import pytest
 from pytest_mock import MockerFixture
+from pytestqt.qtbot import QtBot
 from qgis.core import QgsRectangle
 from qgis.gui import QgisInterface
 from qgis.PyQt.QtCore import QAbstractItemModel, QModelIndex, Qt
@@ -30,10 +33,16 @@ from quality_result_gui.quality_error_manager import QualityResultManager
 from quality_result_gui.quality_error_visualizer import QualityErrorVisualizer
 
 
+@cache
+def _get_priority_label(priority: QualityErrorPriority) -> str:
+    # Translated on first use, not on import
+    return ERROR_PRIORITY_LABEL[priority]()
+
+
 # index of fatal errors in quality error tree model
 def _count_num_fatal_rows(model: QAbstractItemModel) -> int:
     first_index = model.index(0, 0, QModelIndex())
-    if first_index.data() == ERROR_PRIORITY_LABEL[QualityErrorPriority.FATAL]():
+    if first_index.data() == _get_priority_label(QualityErrorPriority.FATAL):
         return _count_children_rows(model, model.index(0, 0, QModelIndex()))
     else:
         return 0
@@ -42,9 +51,9 @@ def _count_num_fatal_rows(model: QAbstractItemModel) -> int:
 # index of warnings in quality error tree model
 def _count_num_warning_rows(model: QAbstractItemModel) -> int:
     first_index = model.index(0, 0, QModelIndex())
-    if first_index.data() == ERROR_PRIORITY_LABEL[QualityErrorPriority.FATAL]():
+    if first_index.data() == _get_priority_label(QualityErrorPriority.FATAL):
         return _count_children_rows(model, model.index(1, 0, QModelIndex()))
-    elif first_index.data() == ERROR_PRIORITY_LABEL[QualityErrorPriority.WARNING]():
+    elif first_index.data() == _get_priority_label(QualityErrorPriority.WARNING):
         return _count_children_rows(model, model.index(0, 0, QModelIndex()))
     else:
         return 0
@@ -53,11 +62,14 @@ def _count_num_warning_rows(model: QAbstractItemModel) -> int:
 def _count_children_rows(model: QAbstractItemModel, priority_index: QModelIndex) -> int:
     if not priority_index.isValid():
         return 0
+    row_count = model.rowCount
     num_rows = 0
-    for i in range(model.rowCount(priority_index)):
+    for i in range(row_count(priority_index)):
         feature_type_index = priority_index.child(i, 0)
-        for j in range(model.rowCount(feature_type_index)):
-            num_rows += model.rowCount(feature_type_index.child(j, 0))
+        num_rows += sum(
+            row_count(feature_type_index.child(j, 0))
+            for j in range(row_count(feature_type_index))
+        )
     return num_rows
 
 
@@ -76,6 +88,7 @@ def _count_children_rows(model: QAbstractItemModel, priority_index: QModelIndex)
 )
 def test_filter_with_map_extent_check_box(
     qgis_iface: QgisInterface,
+    qtbot: QtBot,
     quality_result_manager_with_data: QualityResultManager,
     mocker: MockerFixture,
     extent: QgsRectangle,
@@ -98,8 +111,12 @@ def test_filter_with_map_extent_check_box(
         "_extent",
         return_value=extent,
     )
-    # Test by changing map extent
-    qgis_iface.mapCanvas().setExtent(extent)
+    # Test by changing map extent, filter is updated after a debounce interval
+    with qtbot.waitSignal(
+        quality_result_manager_with_data._filter_map_extent_model.filter_invalidated,
+        timeout=1000,
+    ):
+        qgis_iface.mapCanvas().setExtent(extent)
 
     assert _count_num_fatal_rows(model) == expected_fatal_count
     assert _count_num_warning_rows(model) == expected_warning_count
@@ -127,6 +144,7 @@ def test_filter_with_user_processed_check_box(
 
 def test_filter_with_user_processed_check_box_and_map_extent_check_box(
     qgis_iface: QgisInterface,
+    qtbot: QtBot,
     quality_result_manager_with_data: QualityResultManager,
     mocker: MockerFixture,
 ) -> None:
@@ -154,7 +172,11 @@ def test_filter_with_user_processed_check_box_and_map_extent_check_box(
         return_value=extent,
     )
     # Filter first by map extent
-    qgis_iface.mapCanvas().setExtent(extent)
+    with qtbot.waitSignal(
+        quality_result_manager_with_data._filter_map_extent_model.filter_invalidated,
+        timeout=1000,
+    ):
+        qgis_iface.mapCanvas().setExtent(extent)
     assert _count_num_fatal_rows(model) == 2
     assert _count_num_warning_rows(model) == 1
 
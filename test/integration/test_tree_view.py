@@ -18,6 +18,7 @@
 #  along with quality-result-gui. If not, see <https://www.gnu.org/licenses/>.
 
 from copy import copy
+from unittest.mock import MagicMock
 
 import pytest
 from pytest_mock import MockerFixture
@@ -25,6 +26,7 @@ from pytestqt.qtbot import QtBot
 from qgis.core import QgsGeometry, QgsRectangle
 from qgis.gui import QgisInterface
 from qgis.PyQt.QtCore import QAbstractItemModel, QCoreApplication, QModelIndex, Qt
+from quality_result_gui import SelectionType
 from quality_result_gui.api.types.quality_error import (
     QualityError,
     QualityErrorPriority,
@@ -232,6 +234,50 @@ def test_clicking_tree_view_row_zooms_to_feature_if_feature_or_quality_error_sel
     assert item_selected_signal.signal_triggered == should_trigger_selected_signal
 
 
+def test_programmatic_current_row_changes_emit_selection_once(
+    quality_result_manager_with_data: QualityResultManager,
+    qtbot: QtBot,
+) -> None:
+    tree = quality_result_manager_with_data.dock_widget.error_tree_view
+    model = tree.model()
+    feature_index = model.index(0, 0, model.index(0, 0, model.index(0, 0)))
+    m_quality_error_selected = MagicMock()
+    tree.quality_error_selected.connect(m_quality_error_selected)
+
+    tree.setCurrentIndex(model.index(0, 0, feature_index))
+    tree.setCurrentIndex(model.index(1, 0, feature_index))
+
+    m_quality_error_selected.assert_not_called()
+
+    qtbot.waitUntil(lambda: m_quality_error_selected.call_count == 1, timeout=200)
+
+    quality_error, selection_type = m_quality_error_selected.call_args[0]
+    assert quality_error.unique_identifier == "2"
+    assert selection_type == SelectionType.Other
+
+
+def test_programmatic_reselection_of_same_error_is_not_emitted(
+    quality_result_manager_with_data: QualityResultManager,
+    qtbot: QtBot,
+) -> None:
+    tree = quality_result_manager_with_data.dock_widget.error_tree_view
+    model = tree.model()
+    feature_index = model.index(0, 0, model.index(0, 0, model.index(0, 0)))
+    error_index = model.index(0, 0, feature_index)
+    m_quality_error_selected = MagicMock()
+    tree.quality_error_selected.connect(m_quality_error_selected)
+
+    tree.setCurrentIndex(error_index)
+    qtbot.waitUntil(lambda: m_quality_error_selected.call_count == 1, timeout=200)
+
+    # Moving through a feature row back to the same error is not a new selection
+    tree.setCurrentIndex(feature_index)
+    tree.setCurrentIndex(error_index)
+    qtbot.wait(10)
+
+    assert m_quality_error_selected.call_count == 1
+
+
 def test_changing_model_data_sends_error_geometries_to_visualizer(
     mocker: MockerFixture,
     quality_result_manager: QualityResultManager,
@@ -282,6 +328,76 @@ def test_changing_model_data_sends_error_geometries_to_visualizer(
     assert quality_errors[1].geometry.isGeosEqual(QgsGeometry.fromWkt("Point(0 0)"))
 
 
+def test_inserted_and_removed_errors_are_emitted_as_lists(
+    quality_result_manager: QualityResultManager,
+    quality_errors: list[QualityError],
+) -> None:
+    tree_view = quality_result_manager.dock_widget.error_tree_view
+    m_errors_inserted = MagicMock()
+    m_errors_removed = MagicMock()
+    tree_view.errors_inserted.connect(m_errors_inserted)
+    tree_view.errors_removed.connect(m_errors_removed)
+
+    quality_result_manager._fetcher.results_received.emit(quality_errors)
+
+    inserted_errors = [
+        error
+        for call_args in m_errors_inserted.call_args_list
+        for error in call_args[0][0]
+    ]
+    assert all(
+        isinstance(call_args[0][0], list) and len(call_args[0][0]) > 0
+        for call_args in m_errors_inserted.call_args_list
+    )
+    assert sorted(error.unique_identifier for error in inserted_errors) == sorted(
+        error.unique_identifier for error in quality_errors
+    )
+
+    quality_result_manager._fetcher.results_received.emit([])
+
+    removed_errors = [
+        error
+        for call_args in m_errors_removed.call_args_list
+        for error in call_args[0][0]
+    ]
+    assert sorted(error.unique_identifier for error in removed_errors) == sorted(
+        error.unique_identifier for error in quality_errors
+    )
+
+
+def test_refreshed_errors_are_emitted_once_per_refresh(
+    quality_result_manager_with_data: QualityResultManager,
+    quality_errors: list[QualityError],
+) -> None:
+    tree_view = quality_result_manager_with_data.dock_widget.error_tree_view
+    m_errors_inserted = MagicMock()
+    m_errors_removed = MagicMock()
+    tree_view.errors_inserted.connect(m_errors_inserted)
+    tree_view.errors_removed.connect(m_errors_removed)
+
+    # Remove errors from different feature types in one refresh
+    quality_result_manager_with_data._fetcher.results_received.emit(
+        quality_errors[1:-1]
+    )
+
+    m_errors_inserted.assert_not_called()
+    m_errors_removed.assert_called_once()
+    removed_errors = m_errors_removed.call_args[0][0]
+    assert sorted(error.unique_identifier for error in removed_errors) == sorted(
+        [quality_errors[0].unique_identifier, quality_errors[-1].unique_identifier]
+    )
+
+    m_errors_removed.reset_mock()
+    quality_result_manager_with_data._fetcher.results_received.emit(quality_errors)
+
+    m_errors_removed.assert_not_called()
+    m_errors_inserted.assert_called_once()
+    inserted_errors = m_errors_inserted.call_args[0][0]
+    assert sorted(error.unique_identifier for error in inserted_errors) == sorted(
+        [quality_errors[0].unique_identifier, quality_errors[-1].unique_identifier]
+    )
+
+
 def test_model_reset_expands_error_rows_recursively_on_tree_view(
     quality_result_manager_with_data: QualityResultManager,
     quality_errors: list[QualityError],
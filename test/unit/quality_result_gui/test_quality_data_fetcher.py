@@ -29,6 +29,7 @@ from quality_result_gui.api.quality_api_client import (
     QualityResultClientError,
     QualityResultServerError,
 )
+from quality_result_gui.api.types.quality_error import QualityError
 from quality_result_gui.quality_data_fetcher import (
     BackgroundQualityResultsFetcher,
     CheckStatus,
@@ -108,3 +109,28 @@ def test_run_background_check_status_signals(
         assert mock_callback.call_count > 0
     else:
         mock_callback.assert_not_called()
+
+
+def test_unchanged_results_are_emitted_only_once(
+    mocker: MockerFixture,
+    quality_result_fetcher: BackgroundQualityResultsFetcher,
+    qtbot: QtBot,
+    quality_errors: list[QualityError],
+):
+    get_results = mocker.patch.object(
+        quality_result_fetcher._api_client,
+        "get_results",
+        return_value=quality_errors,
+    )
+
+    mock_callback = MagicMock()
+    quality_result_fetcher.results_received.connect(mock_callback)
+
+    quality_result_fetcher.set_checks_enabled(True)
+
+    qtbot.waitUntil(
+        lambda: get_results.call_count >= 3 and mock_callback.call_count > 0,
+        timeout=1000,
+    )
+
+    mock_callback.assert_called_once_with(quality_errors)
@@ -17,6 +17,7 @@
 #  You should have received a copy of the GNU General Public License
 #  along with quality-result-gui. If not, see <https://www.gnu.org/licenses/>.
 
+from functools import partial
 from typing import Callable, Optional
 from unittest.mock import ANY
 
@@ -149,6 +150,21 @@ def test_filter_menu_set_sorted_works_when_action_added(
     ]
 
 
+def test_filter_menu_is_any_filter_active(simple_menu: FilterMenu):
+    assert simple_menu.is_any_filter_active() is False
+
+    action = simple_menu.actions()[0]
+    action.setChecked(False)
+    assert simple_menu.is_any_filter_active() is True
+
+    action.setChecked(True)
+    assert simple_menu.is_any_filter_active() is False
+
+    action.setChecked(False)
+    simple_menu.remove_filter_action(action)
+    assert simple_menu.is_any_filter_active() is False
+
+
 def test_deselect_action_unchecks_all(
     get_action_from_menu: Callable[[QMenu, str], Optional[QAction]],
     trigger_action: Callable[[QMenu, str], None],
@@ -188,3 +204,46 @@ def test_select_action_checks_all(
         filter_action = get_action_from_menu(error_type_filter_menu.menu, error_type())
         assert filter_action is not None
         assert filter_action.isChecked() is True
+
+
+def test_deselect_and_select_all_notify_filter_changes_once(
+    trigger_action: Callable[[QMenu, str], None],
+):
+    error_type_filter = ErrorTypeFilter()
+    emitted = []
+    error_type_filter.filters_changed.connect(lambda: emitted.append(True))
+
+    trigger_action(error_type_filter.menu, "Deselect all")
+
+    assert len(emitted) == 1
+    assert error_type_filter._accepted_values == set()
+    assert error_type_filter.menu.is_any_filter_active() is True
+
+    trigger_action(error_type_filter.menu, "Select all")
+
+    assert len(emitted) == 2
+    assert error_type_filter._accepted_values == set(ERROR_TYPE_LABEL.keys())
+    assert error_type_filter.menu.is_any_filter_active() is False
+
+
+def test_deselect_and_select_all_emit_toggled_for_each_action(
+    simple_menu: FilterMenu,
+    trigger_action: Callable[[QMenu, str], None],
+):
+    simple_menu.set_select_all_section_enabled(True)
+    toggled = []
+    for action in simple_menu._filter_actions:
+        action.toggled.connect(
+            partial(
+                lambda label, checked: toggled.append((label, checked)), action.text()
+            )
+        )
+
+    trigger_action(simple_menu, "Deselect all")
+
+    assert sorted(toggled) == [("a", False), ("b", False), ("c", False)]
+
+    toggled.clear()
+    trigger_action(simple_menu, "Select all")
+
+    assert sorted(toggled) == [("a", True), ("b", True), ("c", True)]
@@ -17,10 +17,15 @@
 #  You should have received a copy of the GNU General Public License
 #  along with quality-result-gui. If not, see <https://www.gnu.org/licenses/>.
 
+from dataclasses import replace
 from typing import NamedTuple, Optional
 
 import pytest
+from pytest_mock import MockerFixture
 from pytestqt.modeltest import ModelTester
+from pytestqt.qtbot import QtBot
+from qgis.core import QgsRectangle
+from qgis.gui import QgisInterface
 from qgis.PyQt.QtCore import QAbstractItemModel, QModelIndex, Qt, QVariant
 from quality_result_gui.api.types.quality_error import (
     ERROR_TYPE_LABEL,
@@ -37,7 +42,9 @@ from quality_result_gui.quality_errors_tree_model import (
     FilterByShowUserProcessedProxyModel,
     FilterProxyModel,
     QualityErrorsTreeBaseModel,
+    QualityErrorTreeItemType,
     StyleProxyModel,
+    _get_quality_errors_indexes,
     get_error_feature_attributes,
     get_error_feature_types,
 )
@@ -210,6 +217,32 @@ def test_base_model(
     qtmodeltester.check(base_model)
 
 
+def test_base_model_has_children(
+    base_model: QualityErrorsTreeBaseModel,
+    quality_errors: list[QualityError],
+) -> None:
+    assert base_model.hasChildren(QModelIndex()) is False
+
+    base_model.refresh_model(quality_errors)
+
+    assert base_model.hasChildren(QModelIndex()) is True
+    assert base_model.hasChildren(
+        _priority_1_feature_type_1_feature_1_index(base_model)
+    )
+    assert (
+        base_model.hasChildren(
+            _priority_1_feature_type_1_feature_1_error_1_index(base_model)
+        )
+        is False
+    )
+    assert (
+        base_model.hasChildren(
+            _priority_1_feature_type_1_feature_1_error_1_description_index(base_model)
+        )
+        is False
+    )
+
+
 def test_model_index(model: FilterByExtentProxyModel):
     priority_1_index = _priority_1_index(model)
     assert priority_1_index.isValid()
@@ -657,6 +690,60 @@ def test_refresh_model_updates_data_partially_when_data_is_refreshed(
     )
 
 
+def test_refresh_model_inserts_rows_once_per_parent(
+    base_model: QualityErrorsTreeBaseModel,
+    quality_errors: list[QualityError],
+    mocker: MockerFixture,
+):
+    m_rows_inserted = mocker.MagicMock()
+    base_model.rowsInserted.connect(m_rows_inserted)
+
+    base_model.refresh_model(quality_errors)
+
+    # All feature types are new, so they are inserted with their children
+    # once under each priority
+    priorities = {error.priority for error in quality_errors}
+    assert m_rows_inserted.call_count == len(priorities)
+    for parent, first, last in (
+        call_args[0] for call_args in m_rows_inserted.call_args_list
+    ):
+        assert parent.parent() == QModelIndex()
+        assert first == 0
+        assert last == base_model.rowCount(parent) - 1
+
+    num_fatal_rows = _count_quality_error_rows(
+        base_model, _priority_1_index(base_model)
+    )
+    num_warning_rows = _count_quality_error_rows(
+        base_model, _priority_2_index(base_model)
+    )
+    assert num_fatal_rows + num_warning_rows == len(quality_errors)
+
+
+def test_refresh_model_removes_all_errors_with_duplicated_id(
+    base_model: QualityErrorsTreeBaseModel,
+    quality_errors: list[QualityError],
+):
+    duplicated_error = replace(quality_errors[1], error_id=100)
+    assert duplicated_error.unique_identifier == quality_errors[1].unique_identifier
+
+    base_model.refresh_model([*quality_errors, duplicated_error])
+
+    assert _count_quality_error_rows(base_model, _priority_1_index(base_model)) == 5
+
+    # Remove both errors with the duplicated id
+    base_model.refresh_model(quality_errors[2:])
+
+    error_ids = [
+        index.data(Qt.UserRole)[1].unique_identifier
+        for index in _get_quality_errors_indexes(
+            base_model, _priority_1_index(base_model)
+        )
+    ]
+    assert quality_errors[1].unique_identifier not in error_ids
+    assert len(error_ids) == 2
+
+
 def test_refresh_model_does_nothing_if_data_does_not_change(
     base_model: QualityErrorsTreeBaseModel,
     quality_errors: list[QualityError],
@@ -707,3 +794,102 @@ def test_no_rows_visible_when_all_user_processed(
 
     assert _count_quality_error_rows(model, _priority_1_index(model)) == 0
     assert _count_quality_error_rows(model, _priority_2_index(model)) == 0
+
+
+def test_map_extent_changes_are_debounced(
+    model: FilterByExtentProxyModel,
+    mocker: MockerFixture,
+    qtbot: QtBot,
+):
+    model.set_enabled(True)
+    m_set_extent = mocker.patch.object(model, "set_extent", autospec=True)
+
+    for _ in range(5):
+        model._on_map_extent_changed()
+
+    m_set_extent.assert_not_called()
+
+    qtbot.waitUntil(lambda: m_set_extent.call_count == 1, timeout=1000)
+    qtbot.wait(2 * FilterByExtentProxyModel.EXTENT_CHANGE_DEBOUNCE_INTERVAL)
+    m_set_extent.assert_called_once()
+
+    model.set_enabled(False)
+
+
+def test_map_extent_changes_are_connected_once(
+    model: FilterByExtentProxyModel,
+    mocker: MockerFixture,
+    qgis_iface: QgisInterface,
+):
+    m_on_map_extent_changed = mocker.patch.object(model, "_on_map_extent_changed")
+
+    model.set_enabled(True)
+    model.set_enabled(True)
+    qgis_iface.mapCanvas().extentsChanged.emit()
+
+    m_on_map_extent_changed.assert_called_once()
+
+    model.set_enabled(False)
+    model.set_enabled(False)
+    qgis_iface.mapCanvas().extentsChanged.emit()
+
+    m_on_map_extent_changed.assert_called_once()
+
+
+def test_map_extent_filter_matches_geometry_intersections(
+    model: FilterByExtentProxyModel,
+    quality_errors: list[QualityError],
+):
+    def visible_error_ids() -> set[str]:
+        error_ids = set()
+        for i in range(model.rowCount(QModelIndex())):
+            for index in _get_quality_errors_indexes(
+                model, model.index(i, 0, QModelIndex())
+            ):
+                item_type, quality_error = index.data(Qt.UserRole)
+                assert item_type == QualityErrorTreeItemType.ERROR
+                error_ids.add(quality_error.unique_identifier)
+        return error_ids
+
+    # Extents are applied repeatedly, so that the later ones are filtered
+    # with the spatial index built during the first ones
+    for extent in [
+        QgsRectangle(10, 10, 100, 100),
+        QgsRectangle(0, 0, 100, 100),
+        QgsRectangle(12, 12, 13, 13),
+        QgsRectangle(10, 10, 100, 100),
+        QgsRectangle(1000, 1000, 2000, 2000),
+    ]:
+        model.set_extent(extent)
+
+        assert visible_error_ids() == {
+            error.unique_identifier
+            for error in quality_errors
+            if error.geometry.intersects(extent)
+        }
+
+
+def test_removed_error_is_removed_from_map_extent_spatial_index(
+    model: FilterByExtentProxyModel,
+    base_model: QualityErrorsTreeBaseModel,
+    quality_errors: list[QualityError],
+):
+    def error_ids_near(extent: QgsRectangle) -> set[str]:
+        return {
+            model._indexed_error_ids[feature_id]
+            for feature_id in model._spatial_index.intersects(extent)
+        }
+
+    # Errors are indexed when they are filtered by the extent
+    model.set_extent(QgsRectangle(0, 0, 100, 100))
+    removed_error, *remaining_errors = quality_errors
+    assert removed_error.unique_identifier in error_ids_near(
+        removed_error.geometry.boundingBox()
+    )
+
+    base_model.refresh_model(remaining_errors)
+
+    assert removed_error.unique_identifier not in model._indexed_errors
+    assert removed_error.unique_identifier not in error_ids_near(
+        removed_error.geometry.boundingBox()
+    )
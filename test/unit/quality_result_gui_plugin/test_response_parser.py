@@ -0,0 +1,98 @@
+#  Copyright (C) 2022-2023 National Land Survey of Finland
+#  (https://www.maanmittauslaitos.fi/en).
+#
+#
+#  This file is part of quality-result-gui.
+#
+#  quality-result-gui is free software: you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  quality-result-gui is distributed in the hope that it will be
+#  useful, but WITHOUT ANY WARRANTY; without even the implied warranty
+#  of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with quality-result-gui. If not, see <https://www.gnu.org/licenses/>.
+
+from qgis.core import QgsGeometry
+from quality_result_gui.api.types.quality_error import (
+    QualityError,
+    QualityErrorPriority,
+    QualityErrorType,
+)
+from quality_result_gui_plugin.dev_tools.response_parser import parse_quality_errors
+
+PAYLOAD = b"""[
+  {
+    "priority": 1,
+    "feature_type": "building_part_area",
+    "feature_id": "aa4a7f24",
+    "error_id": 2,
+    "unique_identifier": "2",
+    "error_type": 1,
+    "attribute_name": "vtj_prt",
+    "error_description": "Invalid value",
+    "extra_info": null,
+    "is_user_processed": false,
+    "wkt_geom": "POLYGON ((0 0, 0 5, 5 5, 5 0, 0 0))"
+  },
+  {
+    "priority": 2,
+    "feature_type": "chimney_point",
+    "feature_id": "7067408f",
+    "error_id": 3,
+    "unique_identifier": "3",
+    "error_type": 2,
+    "attribute_name": null,
+    "error_description": "Invalid geometry",
+    "extra_info": {"details": "Self intersection"},
+    "is_user_processed": true,
+    "wkt_geom": "POINT Z (1 2 3)"
+  }
+]"""
+
+
+def test_parse_quality_errors():
+    expected_quality_errors = [
+        QualityError(
+            QualityErrorPriority.FATAL,
+            "building_part_area",
+            "aa4a7f24",
+            2,
+            "2",
+            QualityErrorType.ATTRIBUTE,
+            "vtj_prt",
+            "Invalid value",
+            None,
+            QgsGeometry.fromWkt("POLYGON ((0 0, 0 5, 5 5, 5 0, 0 0))"),
+            False,
+        ),
+        QualityError(
+            QualityErrorPriority.WARNING,
+            "chimney_point",
+            "7067408f",
+            3,
+            "3",
+            QualityErrorType.GEOMETRY,
+            None,
+            "Invalid geometry",
+            {"details": "Self intersection"},
+            QgsGeometry.fromWkt("POINT Z (1 2 3)"),
+            True,
+        ),
+    ]
+
+    quality_errors = parse_quality_errors(PAYLOAD)
+
+    assert len(quality_errors) == len(expected_quality_errors)
+    for quality_error, expected_quality_error in zip(
+        quality_errors, expected_quality_errors
+    ):
+        assert quality_error.geometry.equals(expected_quality_error.geometry)
+        quality_error_fields = vars(quality_error).copy()
+        expected_quality_error_fields = vars(expected_quality_error).copy()
+        del quality_error_fields["geometry"], expected_quality_error_fields["geometry"]
+        assert quality_error_fields == expected_quality_error_fields